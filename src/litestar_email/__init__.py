@@ -1,37 +1,40 @@
-from litestar_email.backends import (
-    BaseEmailBackend,
-    ConsoleBackend,
-    InMemoryBackend,
-    MailgunBackend,
-    ResendBackend,
-    SendGridBackend,
-    SMTPBackend,
-    get_backend,
-    get_backend_class,
-    list_backends,
-    register_backend,
-)
-from litestar_email.config import (
-    AsyncServiceProvider,
-    BackendConfig,
-    EmailConfig,
-    MailgunConfig,
-    ResendConfig,
-    SendGridConfig,
-    SMTPConfig,
-)
-from litestar_email.exceptions import (
-    EmailAuthenticationError,
-    EmailBackendError,
-    EmailConnectionError,
-    EmailDeliveryError,
-    EmailError,
-    EmailRateLimitError,
-    MissingDependencyError,
-)
-from litestar_email.message import EmailMessage, EmailMultiAlternatives
-from litestar_email.plugin import EmailPlugin
-from litestar_email.service import EmailService
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from litestar_email.backends import (
+        BaseEmailBackend,
+        ConsoleBackend,
+        InMemoryBackend,
+        MailgunBackend,
+        ResendBackend,
+        SendGridBackend,
+        SMTPBackend,
+        get_backend,
+        get_backend_class,
+        list_backends,
+        register_backend,
+    )
+    from litestar_email.config import (
+        AsyncServiceProvider,
+        BackendConfig,
+        EmailConfig,
+        MailgunConfig,
+        ResendConfig,
+        SendGridConfig,
+        SMTPConfig,
+    )
+    from litestar_email.exceptions import (
+        EmailAuthenticationError,
+        EmailBackendError,
+        EmailConnectionError,
+        EmailDeliveryError,
+        EmailError,
+        EmailRateLimitError,
+        MissingDependencyError,
+    )
+    from litestar_email.message import EmailMessage, EmailMultiAlternatives
+    from litestar_email.plugin import EmailPlugin
+    from litestar_email.service import EmailService, send_mass_mail
 
 __all__ = (
     "AsyncServiceProvider",
@@ -63,4 +66,76 @@ __all__ = (
     "get_backend_class",
     "list_backends",
     "register_backend",
+    "send_mass_mail",
 )
+
+# Public names resolved lazily via ``__getattr__`` (name -> defining module)
+_LAZY: dict[str, str] = {
+    "AsyncServiceProvider": "litestar_email.config",
+    "BackendConfig": "litestar_email.config",
+    "BaseEmailBackend": "litestar_email.backends",
+    "ConsoleBackend": "litestar_email.backends",
+    "EmailAuthenticationError": "litestar_email.exceptions",
+    "EmailBackendError": "litestar_email.exceptions",
+    "EmailConfig": "litestar_email.config",
+    "EmailConnectionError": "litestar_email.exceptions",
+    "EmailDeliveryError": "litestar_email.exceptions",
+    "EmailError": "litestar_email.exceptions",
+    "EmailMessage": "litestar_email.message",
+    "EmailMultiAlternatives": "litestar_email.message",
+    "EmailPlugin": "litestar_email.plugin",
+    "EmailRateLimitError": "litestar_email.exceptions",
+    "EmailService": "litestar_email.service",
+    "InMemoryBackend": "litestar_email.backends",
+    "MailgunBackend": "litestar_email.backends",
+    "MailgunConfig": "litestar_email.config",
+    "MissingDependencyError": "litestar_email.exceptions",
+    "ResendBackend": "litestar_email.backends",
+    "ResendConfig": "litestar_email.config",
+    "SMTPBackend": "litestar_email.backends",
+    "SMTPConfig": "litestar_email.config",
+    "SendGridBackend": "litestar_email.backends",
+    "SendGridConfig": "litestar_email.config",
+    "get_backend": "litestar_email.backends",
+    "get_backend_class": "litestar_email.backends",
+    "list_backends": "litestar_email.backends",
+    "register_backend": "litestar_email.backends",
+    "send_mass_mail": "litestar_email.service",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import for the public API.
+
+    Submodules are only imported when one of their names is first accessed.
+    The resolved value is cached in the module globals so subsequent lookups
+    bypass this function entirely.
+
+    Args:
+        name: The attribute name to look up.
+
+    Returns:
+        The requested public object.
+
+    Raises:
+        AttributeError: If the attribute is not found.
+    """
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names of this module.
+
+    Returns:
+        The names listed in ``__all__``.
+    """
+    return list(__all__)
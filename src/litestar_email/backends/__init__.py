@@ -1,11 +1,17 @@
-from functools import lru_cache
-from importlib import import_module
 from inspect import signature
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from litestar_email.backends.base import BaseEmailBackend
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from litestar_email.backends.console import ConsoleBackend
+    from litestar_email.backends.mailgun import MailgunBackend
+    from litestar_email.backends.memory import InMemoryBackend
+    from litestar_email.backends.resend import ResendBackend
+    from litestar_email.backends.sendgrid import SendGridBackend
+    from litestar_email.backends.smtp import SMTPBackend
     from litestar_email.config import BackendConfig, EmailConfig
 
 __all__ = (
@@ -22,11 +28,36 @@ __all__ = (
     "register_backend",
 )
 
+BackendT = TypeVar("BackendT", bound=BaseEmailBackend)
+
+# Built-in backends: class name -> (short name, defining module). Single source of
+# truth for both the lazy ``__getattr__`` re-exports and the registry bootstrap.
+_BUILTIN_BACKENDS: dict[str, tuple[str, str]] = {
+    "ConsoleBackend": ("console", "litestar_email.backends.console"),
+    "InMemoryBackend": ("memory", "litestar_email.backends.memory"),
+    "SMTPBackend": ("smtp", "litestar_email.backends.smtp"),
+    "ResendBackend": ("resend", "litestar_email.backends.resend"),
+    "SendGridBackend": ("sendgrid", "litestar_email.backends.sendgrid"),
+    "MailgunBackend": ("mailgun", "litestar_email.backends.mailgun"),
+}
+
 # Global registry of backend short names to classes
 _backend_registry: dict[str, type[BaseEmailBackend]] = {}
 
+# Whether the built-in backends have been added to the registry
+_builtins_registered = False
+
+# Snapshot of the registry keys returned by ``list_backends``; reset on registration
+_backends_list_cache: tuple[str, ...] | None = None
+
+# Backend classes resolved from full import paths, keyed by the raw path
+_resolved_backends: dict[str, type[BaseEmailBackend]] = {}
+
+# Per-class ``__init__`` introspection results: (accepts **kwargs, parameter names)
+_signature_cache: dict[type, tuple[bool, frozenset[str]]] = {}
 
-def register_backend(name: str) -> "type[BaseEmailBackend]":
+
+def register_backend(name: str) -> "Callable[[type[BackendT]], type[BackendT]]":
     """Decorator to register a backend class with a short name.
 
     Args:
@@ -44,14 +75,15 @@ def register_backend(name: str) -> "type[BaseEmailBackend]":
                     ...
     """
 
-    def decorator(cls: type[BaseEmailBackend]) -> type[BaseEmailBackend]:
+    def decorator(cls: type[BackendT]) -> type[BackendT]:
+        global _backends_list_cache  # noqa: PLW0603
         _backend_registry[name] = cls
+        _backends_list_cache = None
         return cls
 
-    return decorator  # type: ignore[return-value]
+    return decorator
 
 
-@lru_cache(maxsize=1)
 def _register_builtins() -> None:
     """Register built-in backends. Called lazily to avoid import cycles.
 
@@ -59,19 +91,34 @@ def _register_builtins() -> None:
     are installed. They will raise MissingDependencyError when instantiated
     if the required packages are not available.
     """
-    from litestar_email.backends.console import ConsoleBackend
-    from litestar_email.backends.mailgun import MailgunBackend
-    from litestar_email.backends.memory import InMemoryBackend
-    from litestar_email.backends.resend import ResendBackend
-    from litestar_email.backends.sendgrid import SendGridBackend
-    from litestar_email.backends.smtp import SMTPBackend
+    global _builtins_registered, _backends_list_cache  # noqa: PLW0603
+    if _builtins_registered:
+        return
 
-    _backend_registry.setdefault("console", ConsoleBackend)
-    _backend_registry.setdefault("memory", InMemoryBackend)
-    _backend_registry.setdefault("smtp", SMTPBackend)
-    _backend_registry.setdefault("resend", ResendBackend)
-    _backend_registry.setdefault("sendgrid", SendGridBackend)
-    _backend_registry.setdefault("mailgun", MailgunBackend)
+    for class_name, (short_name, module_path) in _BUILTIN_BACKENDS.items():
+        backend_class = _load_builtin_backend(class_name)
+        _backend_registry.setdefault(short_name, backend_class)
+        # Pre-seed the full import path so it resolves without a dotted-path import
+        _resolved_backends.setdefault(f"{module_path}.{class_name}", backend_class)
+    _backends_list_cache = None
+    _builtins_registered = True
+
+
+def _load_builtin_backend(class_name: str) -> type[BaseEmailBackend]:
+    """Import a built-in backend class and cache it in the module globals.
+
+    Args:
+        class_name: The backend class name, a key of ``_BUILTIN_BACKENDS``.
+
+    Returns:
+        The backend class.
+    """
+    from importlib import import_module
+
+    _, module_path = _BUILTIN_BACKENDS[class_name]
+    backend_class: type[BaseEmailBackend] = getattr(import_module(module_path), class_name)
+    globals()[class_name] = backend_class
+    return backend_class
 
 
 def get_backend_class(backend_path: str) -> type[BaseEmailBackend]:
@@ -96,20 +143,57 @@ def get_backend_class(backend_path: str) -> type[BaseEmailBackend]:
             # By full path
             cls = get_backend_class("litestar_email.backends.console.ConsoleBackend")
     """
-    _register_builtins()
+    if not _builtins_registered:
+        _register_builtins()
 
     # Check registry first
-    if backend_path in _backend_registry:
-        return _backend_registry[backend_path]
+    backend_class = _backend_registry.get(backend_path)
+    if backend_class is not None:
+        return backend_class
+
+    # Then previously resolved import paths
+    backend_class = _resolved_backends.get(backend_path)
+    if backend_class is not None:
+        return backend_class
 
     # Try to import as a full path
-    if "." not in backend_path:
-        msg = f"Unknown backend: {backend_path!r}. Available: {list(_backend_registry.keys())}"
+    idx = backend_path.rfind(".")
+    if idx == -1:
+        msg = f"Unknown backend: {backend_path!r}. Available: {list_backends()}"
+        raise ValueError(msg)
+
+    module_path = backend_path[:idx]
+    class_name = backend_path[idx + 1 :]
+    if not module_path or not class_name.isidentifier():
+        msg = f"Invalid backend import path: {backend_path!r}. Expected 'package.module.ClassName'"
         raise ValueError(msg)
 
-    module_path, class_name = backend_path.rsplit(".", 1)
+    from importlib import import_module
+
     module = import_module(module_path)
-    return getattr(module, class_name)  # type: ignore[no-any-return]
+    backend_class = getattr(module, class_name)
+    _resolved_backends[backend_path] = backend_class
+    return backend_class  # type: ignore[no-any-return]
+
+
+def _inspect_init(backend_class: type[BaseEmailBackend]) -> tuple[bool, frozenset[str]]:
+    """Inspect a backend constructor once and cache the result.
+
+    Args:
+        backend_class: The backend class to inspect.
+
+    Returns:
+        Tuple of (accepts ``**kwargs``, names of the ``__init__`` parameters).
+    """
+    cached = _signature_cache.get(backend_class)
+    if cached is not None:
+        return cached
+
+    parameters = signature(backend_class.__init__).parameters
+    accepts_kwargs = any(param.kind == param.VAR_KEYWORD for param in parameters.values())
+    result = (accepts_kwargs, frozenset(parameters))
+    _signature_cache[backend_class] = result
+    return result
 
 
 def _get_backend_name_for_config(backend_config: "BackendConfig") -> str:
@@ -193,30 +277,35 @@ def get_backend(
         backend_config = backend
 
     # Extract common settings from EmailConfig if provided
-    default_from_email: str | None = None
-    default_from_name: str | None = None
-    resolved_fail_silently = fail_silently if fail_silently is not None else False
-    if config is not None:
-        default_from_email = config.from_email
-        default_from_name = config.from_name
-        if fail_silently is None:
-            resolved_fail_silently = config.fail_silently
-
-    backend_kwargs: dict[str, Any] = {
-        "fail_silently": resolved_fail_silently,
-        "default_from_email": default_from_email,
-        "default_from_name": default_from_name,
-    }
-
-    # Pass config to backend if it was found
-    if backend_config is not None:
+    default_from_email: str | None
+    default_from_name: str | None
+    if config is None:
+        default_from_email = default_from_name = None
+        resolved_fail_silently = bool(fail_silently)
+    else:
+        default_from_email, default_from_name, config_fail_silently = (
+            config.from_email,
+            config.from_name,
+            config.fail_silently,
+        )
+        resolved_fail_silently = config_fail_silently if fail_silently is None else fail_silently
+
+    # Only pass the keyword arguments the backend constructor accepts. Backends
+    # declaring ``__backend_init_fields__`` skip signature inspection entirely.
+    param_names = vars(backend_class).get("__backend_init_fields__")
+    accepts_kwargs = False
+    if param_names is None:
+        accepts_kwargs, param_names = _inspect_init(backend_class)
+    backend_kwargs: dict[str, Any] = {}
+    if accepts_kwargs or "fail_silently" in param_names:
+        backend_kwargs["fail_silently"] = resolved_fail_silently
+    if accepts_kwargs or "default_from_email" in param_names:
+        backend_kwargs["default_from_email"] = default_from_email
+    if accepts_kwargs or "default_from_name" in param_names:
+        backend_kwargs["default_from_name"] = default_from_name
+    if backend_config is not None and (accepts_kwargs or "config" in param_names):
         backend_kwargs["config"] = backend_config
 
-    init_signature = signature(backend_class.__init__)
-    accepts_kwargs = any(param.kind == param.VAR_KEYWORD for param in init_signature.parameters.values())
-    if not accepts_kwargs:
-        backend_kwargs = {key: value for key, value in backend_kwargs.items() if key in init_signature.parameters}
-
     return backend_class(**backend_kwargs)
 
 
@@ -226,16 +315,42 @@ def list_backends() -> list[str]:
     Returns:
         A list of backend names that can be used with get_backend().
     """
-    _register_builtins()
-    return list(_backend_registry.keys())
-
-
-# Re-export backend classes for convenience
-# Backends can be imported regardless of whether dependencies are installed.
-# They raise MissingDependencyError on instantiation if dependencies are missing.
-from litestar_email.backends.console import ConsoleBackend
-from litestar_email.backends.mailgun import MailgunBackend
-from litestar_email.backends.memory import InMemoryBackend
-from litestar_email.backends.resend import ResendBackend
-from litestar_email.backends.sendgrid import SendGridBackend
-from litestar_email.backends.smtp import SMTPBackend
+    global _backends_list_cache  # noqa: PLW0603
+    if not _builtins_registered:
+        _register_builtins()
+    if _backends_list_cache is None:
+        _backends_list_cache = tuple(_backend_registry)
+    return list(_backends_list_cache)
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import for backend implementations.
+
+    Backend modules are only imported when their class is first accessed,
+    so ``import litestar_email.backends`` stays cheap. The resolved class is
+    cached in the module globals, making subsequent lookups plain attribute
+    access.
+
+    Args:
+        name: The attribute name to look up.
+
+    Returns:
+        The requested backend class.
+
+    Raises:
+        AttributeError: If the attribute is not found.
+    """
+    if name not in _BUILTIN_BACKENDS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    return _load_builtin_backend(name)
+
+
+def __dir__() -> list[str]:
+    """Return the public names of this module.
+
+    Returns:
+        The names listed in ``__all__``.
+    """
+    return list(__all__)
@@ -1,13 +1,42 @@
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from email.utils import formataddr, parseaddr
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from typing_extensions import Self
 
+from litestar_email.exceptions import EmailRateLimitError
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
     from litestar_email.message import EmailMessage
 
-__all__ = ("BaseEmailBackend",)
+__all__ = ("BaseEmailBackend", "get_user_agent")
+
+# User-Agent sent by the HTTP API backends, resolved on first use
+_user_agent: str | None = None
+
+
+def get_user_agent() -> str:
+    """Return the ``User-Agent`` header value for HTTP API requests.
+
+    The installed package version is looked up once and cached.
+
+    Returns:
+        ``litestar-email/<version>``, or ``litestar-email`` when the package
+        metadata is unavailable (e.g. running from a source checkout).
+    """
+    global _user_agent  # noqa: PLW0603
+    if _user_agent is None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            _user_agent = f"litestar-email/{version('litestar-email')}"
+        except PackageNotFoundError:
+            _user_agent = "litestar-email"
+    return _user_agent
 
 
 class BaseEmailBackend(ABC):
@@ -28,6 +57,14 @@ class BaseEmailBackend(ABC):
 
     __slots__ = ("_default_from_email", "_default_from_name", "fail_silently")
 
+    __backend_init_fields__: ClassVar[frozenset[str] | None] = None
+    """Keyword arguments accepted by ``__init__`` that :func:`get_backend` may pass.
+
+    Backends that declare this on their own class body let ``get_backend`` skip
+    constructor introspection. When a class leaves it unset, the constructor
+    signature is inspected once and cached instead.
+    """
+
     def __init__(
         self,
         fail_silently: bool = False,
@@ -63,6 +100,31 @@ class BaseEmailBackend(ABC):
         Called automatically when exiting the async context manager.
         """
 
+    @asynccontextmanager
+    async def connection(self) -> "AsyncIterator[Self]":
+        """Keep a single connection open across several ``send_messages`` calls.
+
+        Unlike ``async with backend``, this only closes the connection if it
+        opened it, so nested ``connection()`` blocks (or one inside an already
+        open backend) reuse the outer connection.
+
+        Yields:
+            The backend instance.
+
+        Example:
+            Send many notifications over one connection::
+
+                async with backend.connection():
+                    for message in messages:
+                        await backend.send_messages([message])
+        """
+        opened = await self.open()
+        try:
+            yield self
+        finally:
+            if opened:
+                await self.close()
+
     async def __aenter__(self) -> Self:
         """Enter the async context manager.
 
@@ -103,6 +165,47 @@ class BaseEmailBackend(ABC):
         formatted = formataddr((name, email)) if email else ""
         return email, name, formatted
 
+    async def _send_concurrently(
+        self,
+        messages: list["EmailMessage"],
+        send: "Callable[[EmailMessage], Awaitable[None]]",
+        limit: int,
+    ) -> tuple[int, "tuple[EmailMessage, Exception] | None"]:
+        """Send messages one call each, overlapping up to ``limit`` calls.
+
+        Sends still waiting for a slot are skipped once a call is rate limited,
+        or once any call fails while ``fail_silently`` is False, so a throttled
+        or failing API does not receive the rest of the queue.
+
+        Args:
+            messages: The email messages to send.
+            send: Coroutine function sending a single message.
+            limit: Maximum number of calls in flight at once.
+
+        Returns:
+            The number of messages delivered, and the message and error that
+            stopped the remaining sends (``None`` if every send was attempted).
+        """
+        semaphore = asyncio.Semaphore(limit)
+        num_sent = 0
+        failure: "tuple[EmailMessage, Exception] | None" = None
+
+        async def run(message: "EmailMessage") -> None:
+            nonlocal num_sent, failure
+            async with semaphore:
+                if failure is not None:
+                    return
+                try:
+                    await send(message)
+                except Exception as exc:  # noqa: BLE001
+                    if failure is None and (isinstance(exc, EmailRateLimitError) or not self.fail_silently):
+                        failure = (message, exc)
+                    return
+                num_sent += 1
+
+        await asyncio.gather(*(run(message) for message in messages))
+        return num_sent, failure
+
     @abstractmethod
     async def send_messages(self, messages: list["EmailMessage"]) -> int:
         """Send one or more email messages.
@@ -25,6 +25,8 @@ class ConsoleBackend(BaseEmailBackend):
 
     __slots__ = ("stream",)
 
+    __backend_init_fields__ = frozenset({"fail_silently", "default_from_email", "default_from_name"})
+
     def __init__(
         self,
         fail_silently: bool = False,
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Any
 
-from litestar_email.backends.base import BaseEmailBackend
+from litestar_email.backends.base import BaseEmailBackend, get_user_agent
 from litestar_email.exceptions import (
     EmailDeliveryError,
     EmailRateLimitError,
@@ -65,6 +65,8 @@ class MailgunBackend(BaseEmailBackend):
 
     __slots__ = ("_config", "_transport")
 
+    __backend_init_fields__ = frozenset({"config", "fail_silently", "default_from_email", "default_from_name"})
+
     def __init__(
         self,
         config: "MailgunConfig | None" = None,
@@ -119,6 +121,7 @@ class MailgunBackend(BaseEmailBackend):
 
         self._transport = get_transport(self._config.http_transport)
         await self._transport.open(
+            headers={"User-Agent": get_user_agent()},
             auth=("api", self._config.api_key),
             base_url=base_url,
             timeout=float(self._config.timeout),
@@ -28,6 +28,8 @@ class InMemoryBackend(BaseEmailBackend):
 
     __slots__ = ()
 
+    __backend_init_fields__ = frozenset({"fail_silently", "default_from_email", "default_from_name"})
+
     outbox: ClassVar[list["EmailMessage"]] = []
     """Class-level storage for sent messages. Shared across all instances."""
 
@@ -1,9 +1,8 @@
 """Resend email backend using the Resend HTTP API."""
 
-import base64
 from typing import TYPE_CHECKING, Any
 
-from litestar_email.backends.base import BaseEmailBackend
+from litestar_email.backends.base import BaseEmailBackend, get_user_agent
 from litestar_email.exceptions import (
     EmailDeliveryError,
     EmailRateLimitError,
@@ -18,6 +17,9 @@ if TYPE_CHECKING:
 __all__ = ("ResendBackend",)
 
 RESEND_API_URL = "https://api.resend.com/emails"
+RESEND_BATCH_API_URL = "https://api.resend.com/emails/batch"
+# Resend accepts at most 100 emails per batch request
+RESEND_BATCH_LIMIT = 100
 
 
 class ResendBackend(BaseEmailBackend):
@@ -57,6 +59,8 @@ class ResendBackend(BaseEmailBackend):
 
     __slots__ = ("_config", "_transport")
 
+    __backend_init_fields__ = frozenset({"config", "fail_silently", "default_from_email", "default_from_name"})
+
     def __init__(
         self,
         config: "ResendConfig | None" = None,
@@ -104,15 +108,25 @@ class ResendBackend(BaseEmailBackend):
         if self._transport is not None:
             return False
 
-        from litestar_email.transports import get_transport
+        from litestar_email.transports import get_transport, open_transport
 
         self._transport = get_transport(self._config.http_transport)
-        await self._transport.open(
+        await open_transport(
+            self._transport,
             headers={
                 "Authorization": f"Bearer {self._config.api_key}",
                 "Content-Type": "application/json",
+                "User-Agent": get_user_agent(),
             },
             timeout=float(self._config.timeout),
+            http2=self._config.http2,
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+            connect_timeout=self._config.connect_timeout,
+            read_timeout=self._config.read_timeout,
+            write_timeout=self._config.write_timeout,
+            pool_timeout=self._config.pool_timeout,
         )
         return True
 
@@ -147,17 +161,36 @@ class ResendBackend(BaseEmailBackend):
 
         try:
             num_sent = 0
-            for message in messages:
+            # The batch endpoint does not accept attachments, so those messages
+            # are always sent one request at a time.
+            batch = [message for message in messages if not message.attachments]
+            if len(batch) > 1:
+                single = [message for message in messages if message.attachments]
+            else:
+                batch, single = [], messages
+
+            for start in range(0, len(batch), RESEND_BATCH_LIMIT):
+                chunk = batch[start : start + RESEND_BATCH_LIMIT]
                 try:
-                    await self._send_message(message)
-                    num_sent += 1
+                    await self._send_batch(chunk)
+                    num_sent += len(chunk)
                 except EmailRateLimitError:
-                    # Re-raise rate limit errors for proper handling
                     raise
                 except Exception as exc:
                     if not self.fail_silently:
-                        msg = f"Failed to send email to {message.to} via Resend"
+                        msg = f"Failed to send batch of {len(chunk)} emails via Resend"
                         raise EmailDeliveryError(msg) from exc
+
+            limit = min(self._config.max_concurrency, self._config.max_connections)
+            sent, failure = await self._send_concurrently(single, self._send_message, limit)
+            num_sent += sent
+            if failure is not None:
+                message, error = failure
+                if isinstance(error, EmailRateLimitError):
+                    # Re-raise rate limit errors for proper handling
+                    raise error
+                msg = f"Failed to send email to {message.to} via Resend"
+                raise EmailDeliveryError(msg) from error
             return num_sent
         finally:
             if new_connection:
@@ -168,17 +201,37 @@ class ResendBackend(BaseEmailBackend):
 
         Args:
             message: The email message to send.
+        """
+        await self._post(RESEND_API_URL, self._encode_message(message))
 
-        Raises:
-            RuntimeError: If transport is not initialized.
-            EmailRateLimitError: If rate limited by the API.
-            EmailDeliveryError: If the API returns an error.
+    async def _send_batch(self, messages: list["EmailMessage"]) -> None:
+        """Send several messages in one request via the Resend batch API.
+
+        Args:
+            messages: The email messages to send (at most ``RESEND_BATCH_LIMIT``).
         """
-        if self._transport is None:
-            msg = "Resend transport not initialized"
-            raise RuntimeError(msg)
+        await self._post(RESEND_BATCH_API_URL, self._encode_batch(messages))
+
+    def _encode_batch(self, messages: list["EmailMessage"]) -> list[dict[str, Any]]:
+        """Build the JSON array for the Resend batch endpoint.
+
+        Args:
+            messages: The email messages to encode.
+
+        Returns:
+            One Resend email payload per message.
+        """
+        return [self._encode_message(message) for message in messages]
+
+    def _encode_message(self, message: "EmailMessage") -> dict[str, Any]:
+        """Build the Resend API payload for a single message.
 
-        # Build the request payload
+        Args:
+            message: The email message to encode.
+
+        Returns:
+            The JSON-serializable request payload.
+        """
         _, _, from_formatted = self._resolve_from(message)
         payload: dict[str, Any] = {
             "from": from_formatted,
@@ -214,12 +267,30 @@ class ResendBackend(BaseEmailBackend):
             payload["attachments"] = [
                 {
                     "filename": filename,
-                    "content": base64.b64encode(content).decode("ascii"),
+                    "content": content,
                 }
-                for filename, content, _mimetype in message.attachments
+                for filename, content, _mimetype in message.base64_attachments()
             ]
 
-        response = await self._transport.post(RESEND_API_URL, json=payload)
+        return payload
+
+    async def _post(self, url: str, payload: dict[str, Any] | list[dict[str, Any]]) -> None:
+        """POST a JSON payload to the Resend API and check the response.
+
+        Args:
+            url: The API endpoint.
+            payload: The JSON body to send.
+
+        Raises:
+            RuntimeError: If transport is not initialized.
+            EmailRateLimitError: If rate limited by the API.
+            EmailDeliveryError: If the API returns an error.
+        """
+        if self._transport is None:
+            msg = "Resend transport not initialized"
+            raise RuntimeError(msg)
+
+        response = await self._transport.post(url, json=payload)
 
         # Handle rate limiting
         if response.status_code == 429:
@@ -1,9 +1,9 @@
 """SendGrid email backend using the SendGrid v3 HTTP API."""
 
-import base64
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from litestar_email.backends.base import BaseEmailBackend
+from litestar_email.backends.base import BaseEmailBackend, get_user_agent
 from litestar_email.exceptions import (
     EmailDeliveryError,
     EmailRateLimitError,
@@ -18,6 +18,25 @@ if TYPE_CHECKING:
 __all__ = ("SendGridBackend",)
 
 SENDGRID_API_URL = "https://api.sendgrid.com/v3/mail/send"
+# SendGrid caps the total to/cc/bcc recipients across all personalizations of one request
+SENDGRID_MAX_RECIPIENTS = 1000
+
+
+@lru_cache(maxsize=8192)
+def _email_obj(email: str) -> dict[str, str]:
+    """Return the SendGrid email object for an address.
+
+    The same dict is returned for repeated addresses, so mail blasts to
+    overlapping recipient lists do not rebuild it per message. Callers only
+    serialize it and must not mutate it.
+
+    Args:
+        email: The recipient address.
+
+    Returns:
+        A ``{"email": email}`` object.
+    """
+    return {"email": email}
 
 
 class SendGridBackend(BaseEmailBackend):
@@ -57,6 +76,8 @@ class SendGridBackend(BaseEmailBackend):
 
     __slots__ = ("_config", "_transport")
 
+    __backend_init_fields__ = frozenset({"config", "fail_silently", "default_from_email", "default_from_name"})
+
     def __init__(
         self,
         config: "SendGridConfig | None" = None,
@@ -104,15 +125,25 @@ class SendGridBackend(BaseEmailBackend):
         if self._transport is not None:
             return False
 
-        from litestar_email.transports import get_transport
+        from litestar_email.transports import get_transport, open_transport
 
         self._transport = get_transport(self._config.http_transport)
-        await self._transport.open(
+        await open_transport(
+            self._transport,
             headers={
                 "Authorization": f"Bearer {self._config.api_key}",
                 "Content-Type": "application/json",
+                "User-Agent": get_user_agent(),
             },
             timeout=float(self._config.timeout),
+            http2=self._config.http2,
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+            connect_timeout=self._config.connect_timeout,
+            read_timeout=self._config.read_timeout,
+            write_timeout=self._config.write_timeout,
+            pool_timeout=self._config.pool_timeout,
         )
         return True
 
@@ -147,17 +178,38 @@ class SendGridBackend(BaseEmailBackend):
 
         try:
             num_sent = 0
+            # Messages that share sender, content and attachments are merged into
+            # one request with a personalization per message.
+            groups: dict[tuple[Any, ...], list["EmailMessage"]] = {}
             for message in messages:
-                try:
-                    await self._send_message(message)
-                    num_sent += 1
-                except EmailRateLimitError:
+                groups.setdefault(self._batch_key(message), []).append(message)
+
+            single: list["EmailMessage"] = []
+            for group in groups.values():
+                if len(group) == 1:
+                    single.extend(group)
+                    continue
+                for chunk in self._chunk_by_recipients(group):
+                    try:
+                        await self._send_batch(chunk)
+                        num_sent += len(chunk)
+                    except EmailRateLimitError:
+                        raise
+                    except Exception as exc:
+                        if not self.fail_silently:
+                            msg = f"Failed to send batch of {len(chunk)} emails via SendGrid"
+                            raise EmailDeliveryError(msg) from exc
+
+            limit = min(self._config.max_concurrency, self._config.max_connections)
+            sent, failure = await self._send_concurrently(single, self._send_message, limit)
+            num_sent += sent
+            if failure is not None:
+                message, error = failure
+                if isinstance(error, EmailRateLimitError):
                     # Re-raise rate limit errors for proper handling
-                    raise
-                except Exception as exc:
-                    if not self.fail_silently:
-                        msg = f"Failed to send email to {message.to} via SendGrid"
-                        raise EmailDeliveryError(msg) from exc
+                    raise error
+                msg = f"Failed to send email to {message.to} via SendGrid"
+                raise EmailDeliveryError(msg) from error
             return num_sent
         finally:
             if new_connection:
@@ -168,32 +220,114 @@ class SendGridBackend(BaseEmailBackend):
 
         Args:
             message: The email message to send.
+        """
+        await self._post(self._encode_message(message))
 
-        Raises:
-            RuntimeError: If transport is not initialized.
-            EmailRateLimitError: If rate limited by the API.
-            EmailDeliveryError: If the API returns an error.
+    async def _send_batch(self, messages: list["EmailMessage"]) -> None:
+        """Send several messages sharing one envelope in a single request.
+
+        Args:
+            messages: Messages with the same batch key.
         """
-        if self._transport is None:
-            msg = "SendGrid transport not initialized"
-            raise RuntimeError(msg)
+        await self._post(self._encode_batch(messages))
+
+    def _batch_key(self, message: "EmailMessage") -> tuple[Any, ...]:
+        """Return the fields that must match for messages to share a request.
 
-        # Build personalizations (recipients)
+        Recipients, subject and headers can vary per personalization; everything
+        else in a SendGrid payload applies to the whole request.
+
+        Args:
+            message: The email message.
+
+        Returns:
+            A hashable key identifying the shared envelope.
+        """
+        from_email, from_name, _ = self._resolve_from(message)
+        html = next((content for content, mimetype in message.alternatives if mimetype == "text/html"), None)
+        reply_to = message.reply_to[0] if message.reply_to else None
+        return (from_email, from_name, message.body, html, reply_to, tuple(message.attachments))
+
+    @staticmethod
+    def _chunk_by_recipients(messages: list["EmailMessage"]) -> list[list["EmailMessage"]]:
+        """Split messages so no request exceeds ``SENDGRID_MAX_RECIPIENTS``.
+
+        Args:
+            messages: Messages with the same batch key.
+
+        Returns:
+            Lists of messages, each small enough for a single request.
+        """
+        chunks: list[list["EmailMessage"]] = []
+        current: list["EmailMessage"] = []
+        count = 0
+        for message in messages:
+            recipients = len(message.to) + len(message.cc) + len(message.bcc)
+            if current and count + recipients > SENDGRID_MAX_RECIPIENTS:
+                chunks.append(current)
+                current, count = [], 0
+            current.append(message)
+            count += recipients
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _encode_batch(self, messages: list["EmailMessage"]) -> dict[str, Any]:
+        """Build one SendGrid payload with a personalization per message.
+
+        Args:
+            messages: Messages with the same batch key.
+
+        Returns:
+            The JSON-serializable request payload.
+        """
+        payload = self._encode_message(messages[0])
+        payload.pop("headers", None)
+        personalizations = []
+        for message in messages:
+            personalization = self._encode_personalization(message)
+            personalization["subject"] = message.subject
+            if message.headers:
+                personalization["headers"] = message.headers
+            personalizations.append(personalization)
+        payload["personalizations"] = personalizations
+        return payload
+
+    @staticmethod
+    def _encode_personalization(message: "EmailMessage") -> dict[str, Any]:
+        """Build the recipient block for a message.
+
+        Args:
+            message: The email message.
+
+        Returns:
+            A SendGrid personalization object.
+        """
         personalization: dict[str, Any] = {
-            "to": [{"email": email} for email in message.to],
+            "to": [_email_obj(email) for email in message.to],
         }
         if message.cc:
-            personalization["cc"] = [{"email": email} for email in message.cc]
+            personalization["cc"] = [_email_obj(email) for email in message.cc]
         if message.bcc:
-            personalization["bcc"] = [{"email": email} for email in message.bcc]
+            personalization["bcc"] = [_email_obj(email) for email in message.bcc]
+        return personalization
+
+    def _encode_message(self, message: "EmailMessage") -> dict[str, Any]:
+        """Build the SendGrid API payload for a single message.
 
+        Args:
+            message: The email message to encode.
+
+        Returns:
+            The JSON-serializable request payload.
+        """
         # Build the request payload
         from_email, from_name, _ = self._resolve_from(message)
         from_payload: dict[str, str] = {"email": from_email}
         if from_name:
             from_payload["name"] = from_name
         payload: dict[str, Any] = {
-            "personalizations": [personalization],
+            "personalizations": [self._encode_personalization(message)],
             "subject": message.subject,
             "from": from_payload,
         }
@@ -225,12 +359,29 @@ class SendGridBackend(BaseEmailBackend):
             payload["attachments"] = [
                 {
                     "filename": filename,
-                    "content": base64.b64encode(attach_content).decode("ascii"),
+                    "content": attach_content,
                     "type": mimetype,
                 }
-                for filename, attach_content, mimetype in message.attachments
+                for filename, attach_content, mimetype in message.base64_attachments()
             ]
 
+        return payload
+
+    async def _post(self, payload: dict[str, Any]) -> None:
+        """POST a payload to the SendGrid mail/send endpoint and check the response.
+
+        Args:
+            payload: The JSON body to send.
+
+        Raises:
+            RuntimeError: If transport is not initialized.
+            EmailRateLimitError: If rate limited by the API.
+            EmailDeliveryError: If the API returns an error.
+        """
+        if self._transport is None:
+            msg = "SendGrid transport not initialized"
+            raise RuntimeError(msg)
+
         response = await self._transport.post(SENDGRID_API_URL, json=payload)
 
         # Handle rate limiting
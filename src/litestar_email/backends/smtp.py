@@ -1,5 +1,8 @@
 """Async SMTP email backend using aiosmtplib."""
 
+import asyncio
+import contextlib
+import time
 from email.message import EmailMessage as StdEmailMessage
 from typing import TYPE_CHECKING
 
@@ -12,12 +15,174 @@ from litestar_email.exceptions import (
 from litestar_email.utils.module_loader import ensure_aiosmtplib
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     import aiosmtplib
 
     from litestar_email.config import SMTPConfig
     from litestar_email.message import EmailMessage
 
-__all__ = ("SMTPBackend",)
+__all__ = ("SMTPBackend", "SMTPConnectionPool")
+
+
+class _PooledConnection:
+    """A connected SMTP client plus the bookkeeping used for eviction."""
+
+    __slots__ = ("client", "created_at", "uses")
+
+    def __init__(self, client: "aiosmtplib.SMTP") -> None:
+        self.client = client
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+
+class SMTPConnectionPool:
+    """Fixed-size pool of connected SMTP clients.
+
+    The pool holds up to ``size`` clients that have already completed
+    ``EHLO``, ``STARTTLS`` and ``AUTH``, so each message only pays for the
+    ``MAIL``/``RCPT``/``DATA`` exchange. Clients are connected on demand, or
+    up front by :meth:`fill`, and handed out through an :class:`asyncio.Queue`;
+    a sender waits when every client is busy.
+
+    A client is replaced with a fresh connection when it is acquired after
+    being open longer than ``connection_ttl`` seconds, after it has sent
+    ``max_reuse`` messages, or when the server has dropped it.
+
+    Once the pool is closed, clients still in use are quit when they are
+    released, and senders waiting for a client fail instead of hanging.
+    """
+
+    __slots__ = ("_closed", "_connect", "_connection_ttl", "_idle", "_max_reuse", "_opened", "_size")
+
+    def __init__(
+        self,
+        connect: "Callable[[], Awaitable[aiosmtplib.SMTP]]",
+        size: int,
+        connection_ttl: float | None = None,
+        max_reuse: int | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            connect: Coroutine function returning a connected, authenticated client.
+            size: Maximum number of clients kept in the pool.
+            connection_ttl: Seconds a client may stay open before it is replaced.
+            max_reuse: Number of messages a client may send before it is replaced.
+        """
+        self._connect = connect
+        self._size = size
+        self._connection_ttl = connection_ttl
+        self._max_reuse = max_reuse
+        # ``None`` is queued once the pool is closed to wake waiting senders.
+        self._idle: asyncio.Queue[_PooledConnection | None] = asyncio.Queue(maxsize=size)
+        self._opened = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Maximum number of clients kept in the pool."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of clients currently waiting in the pool."""
+        return 0 if self._closed else self._idle.qsize()
+
+    async def fill(self, count: int | None = None) -> None:
+        """Connect clients until the pool holds ``count`` of them.
+
+        If any connection fails, the clients opened so far are closed before
+        the error propagates.
+
+        Args:
+            count: Number of clients to hold, capped at and defaulting to ``size``.
+        """
+        target = self._size if count is None else min(count, self._size)
+        try:
+            while self._opened < target:
+                self._idle.put_nowait(await self._open_client())
+        except BaseException:
+            await self.close()
+            raise
+
+    async def acquire(self) -> "_PooledConnection":
+        """Take a client from the pool, connecting one or waiting until one is free.
+
+        Returns:
+            A connected client, replaced first if it was due for eviction.
+
+        Raises:
+            EmailConnectionError: If the pool has been closed.
+        """
+        if self._idle.empty() and self._opened < self._size and not self._closed:
+            return await self._open_client()
+
+        pooled = await self._idle.get()
+        if pooled is None:
+            # Pass the close signal on to the next waiting sender.
+            self._idle.put_nowait(None)
+            msg = "SMTP connection pool is closed"
+            raise EmailConnectionError(msg)
+        if not self._expired(pooled):
+            return pooled
+        await _quit_quietly(pooled.client)
+        try:
+            return _PooledConnection(await self._connect())
+        except BaseException:
+            # Keep the slot usable: the next acquire retries the connection.
+            self._idle.put_nowait(pooled)
+            raise
+
+    async def release(self, pooled: "_PooledConnection") -> None:
+        """Return a client to the pool after sending a message.
+
+        Args:
+            pooled: The client returned by :meth:`acquire`.
+        """
+        pooled.uses += 1
+        if self._closed:
+            await _quit_quietly(pooled.client)
+            return
+        self._idle.put_nowait(pooled)
+
+    async def close(self) -> None:
+        """Quit every idle client and refuse further use of the pool.
+
+        Clients currently in use are quit when they are released.
+        """
+        self._closed = True
+        while not self._idle.empty():
+            pooled = self._idle.get_nowait()
+            if pooled is not None:
+                await _quit_quietly(pooled.client)
+        self._idle.put_nowait(None)
+
+    async def _open_client(self) -> "_PooledConnection":
+        """Connect a new client, reserving its slot while the connection is made.
+
+        Returns:
+            The newly connected client.
+        """
+        self._opened += 1
+        try:
+            return _PooledConnection(await self._connect())
+        except BaseException:
+            self._opened -= 1
+            raise
+
+    def _expired(self, pooled: "_PooledConnection") -> bool:
+        if not pooled.client.is_connected:
+            return True
+        if self._max_reuse is not None and pooled.uses >= self._max_reuse:
+            return True
+        return self._connection_ttl is not None and time.monotonic() - pooled.created_at >= self._connection_ttl
+
+
+async def _quit_quietly(client: "aiosmtplib.SMTP") -> None:
+    """Quit an SMTP client, ignoring errors from an already broken connection."""
+    with contextlib.suppress(Exception):
+        await client.quit()
 
 
 class SMTPBackend(BaseEmailBackend):
@@ -59,7 +224,9 @@ class SMTPBackend(BaseEmailBackend):
             )
     """
 
-    __slots__ = ("_config", "_connection")
+    __slots__ = ("_config", "_connection", "_idle_callbacks", "_idle_tasks", "_pool", "_reconnect_lock")
+
+    __backend_init_fields__ = frozenset({"config", "fail_silently", "default_from_email", "default_from_name"})
 
     def __init__(
         self,
@@ -95,10 +262,42 @@ class SMTPBackend(BaseEmailBackend):
 
         self._config = config
         self._connection: "aiosmtplib.SMTP | None" = None
+        self._pool: SMTPConnectionPool | None = None
+        self._idle_callbacks: list[Callable[[], Awaitable[None]]] = []
+        self._idle_tasks: set[asyncio.Task[None]] = set()
+        self._reconnect_lock = asyncio.Lock()
+
+    def on_idle(self, callback: "Callable[[], Awaitable[None]]") -> None:
+        """Register a coroutine function to run when a pooled connection frees up.
+
+        This mirrors Nodemailer's ``idle`` event and is meant for push-style
+        senders that pull the next message from their own queue whenever the
+        pool has spare capacity. Callbacks only fire when ``pool_size`` is
+        greater than one.
+
+        Args:
+            callback: Coroutine function called with no arguments.
+        """
+        self._idle_callbacks.append(callback)
 
     async def open(self) -> bool:
         """Open a connection to the SMTP server.
 
+        With ``pool_size`` greater than one, a pool of that many connections
+        is opened instead of a single connection.
+
+        Returns:
+            True if a new connection was opened, False if reusing existing.
+        """
+        return await self._open(prefill=True)
+
+    async def _open(self, *, prefill: bool) -> bool:
+        """Open a single connection or a connection pool.
+
+        Args:
+            prefill: Connect every pooled client up front. Otherwise only one
+                client is connected and the rest are opened as senders need them.
+
         Returns:
             True if a new connection was opened, False if reusing existing.
 
@@ -106,12 +305,41 @@ class SMTPBackend(BaseEmailBackend):
             EmailConnectionError: If connection to the server fails.
             EmailAuthenticationError: If authentication fails.
         """
-        if self._connection is not None:
+        if self._connection is not None or self._pool is not None:
             return False
 
+        try:
+            if self._config.pool_size > 1:
+                pool = SMTPConnectionPool(
+                    self._connect,
+                    size=self._config.pool_size,
+                    connection_ttl=self._config.connection_ttl,
+                    max_reuse=self._config.max_reuse,
+                )
+                await pool.fill(None if prefill else 1)
+                self._pool = pool
+            else:
+                self._connection = await self._connect()
+        except (EmailConnectionError, EmailAuthenticationError):
+            if not self.fail_silently:
+                raise
+            return False
+
+        return True
+
+    async def _connect(self) -> "aiosmtplib.SMTP":
+        """Create a connected and authenticated SMTP client.
+
+        Returns:
+            The connected client.
+
+        Raises:
+            EmailConnectionError: If connection to the server fails.
+            EmailAuthenticationError: If authentication fails.
+        """
         import aiosmtplib
 
-        self._connection = aiosmtplib.SMTP(
+        connection = aiosmtplib.SMTP(
             hostname=self._config.host,
             port=self._config.port,
             timeout=self._config.timeout,
@@ -119,45 +347,39 @@ class SMTPBackend(BaseEmailBackend):
         )
 
         try:
-            await self._connection.connect()
+            await connection.connect()
 
             # STARTTLS upgrade (separate from implicit SSL)
             if self._config.use_tls and not self._config.use_ssl:
-                await self._connection.starttls()
+                await connection.starttls()
 
             # Authenticate if credentials provided
             if self._config.username and self._config.password:
                 try:
-                    await self._connection.login(
+                    await connection.login(
                         self._config.username,
                         self._config.password,
                     )
                 except aiosmtplib.SMTPAuthenticationError as exc:
-                    self._connection = None
                     msg = f"SMTP authentication failed for {self._config.username}"
                     raise EmailAuthenticationError(msg) from exc
 
         except aiosmtplib.SMTPConnectError as exc:
-            self._connection = None
             msg = f"Failed to connect to SMTP server {self._config.host}:{self._config.port}"
-            if not self.fail_silently:
-                raise EmailConnectionError(msg) from exc
-            return False
+            raise EmailConnectionError(msg) from exc
         except EmailAuthenticationError:
-            if not self.fail_silently:
-                raise
-            return False
+            raise
         except Exception as exc:
-            self._connection = None
             msg = f"SMTP connection error: {exc}"
-            if not self.fail_silently:
-                raise EmailConnectionError(msg) from exc
-            return False
+            raise EmailConnectionError(msg) from exc
 
-        return True
+        return connection
 
     async def close(self) -> None:
         """Close the connection to the SMTP server."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
         if self._connection is not None:
             try:
                 await self._connection.quit()
@@ -185,10 +407,14 @@ class SMTPBackend(BaseEmailBackend):
         if not messages:
             return 0
 
-        # Use context manager pattern if not already connected
-        new_connection = await self.open()
+        # Use context manager pattern if not already connected. A one-off
+        # send only connects the pooled clients it actually uses.
+        new_connection = await self._open(prefill=False)
 
         try:
+            if self._pool is not None:
+                return await self._send_pooled(messages)
+
             num_sent = 0
             for message in messages:
                 try:
@@ -204,21 +430,99 @@ class SMTPBackend(BaseEmailBackend):
             if new_connection:
                 await self.close()
 
+    async def _send_pooled(self, messages: list["EmailMessage"]) -> int:
+        """Send messages concurrently over the connection pool.
+
+        Args:
+            messages: List of EmailMessage instances to send.
+
+        Returns:
+            Number of messages successfully sent.
+
+        Raises:
+            EmailDeliveryError: If sending fails and fail_silently is False.
+        """
+        results = await asyncio.gather(
+            *(self._send_message(message) for message in messages),
+            return_exceptions=True,
+        )
+
+        num_sent = 0
+        for message, result in zip(messages, results, strict=True):
+            if isinstance(result, BaseException):
+                if not self.fail_silently:
+                    msg = f"Failed to send email to {message.to}"
+                    raise EmailDeliveryError(msg) from result
+                continue
+            num_sent += 1
+        return num_sent
+
     async def _send_message(self, message: "EmailMessage") -> None:
         """Send a single message.
 
+        Uses a pooled connection when the pool is open, otherwise the single
+        connection opened by :meth:`open`, reconnecting first if the server
+        has dropped it.
+
         Args:
             message: The email message to send.
 
         Raises:
             RuntimeError: If connection is not established.
         """
+        if self._pool is not None:
+            pool = self._pool
+            email_msg = self._build_message(message)
+            pooled = await pool.acquire()
+            try:
+                await pooled.client.send_message(email_msg)
+            finally:
+                await pool.release(pooled)
+                self._notify_idle()
+            return
+
         if self._connection is None:
             msg = "SMTP connection not established"
             raise RuntimeError(msg)
 
         email_msg = self._build_message(message)
-        await self._connection.send_message(email_msg)
+        connection = self._connection
+        if not connection.is_connected:
+            connection = await self._reconnect(connection)
+        await connection.send_message(email_msg)
+
+    async def _reconnect(self, stale: "aiosmtplib.SMTP") -> "aiosmtplib.SMTP":
+        """Replace a single connection that the server has dropped.
+
+        Long-lived backends (such as the application-wide service) would
+        otherwise keep failing once the server closes an idle connection.
+
+        Args:
+            stale: The disconnected client seen by the caller.
+
+        Returns:
+            The connected client to send with.
+
+        Raises:
+            RuntimeError: If the backend was closed while reconnecting.
+        """
+        async with self._reconnect_lock:
+            # Another sender may have replaced the connection while we waited.
+            if self._connection is stale:
+                await _quit_quietly(stale)
+                self._connection = await self._connect()
+        if self._connection is None:
+            msg = "SMTP connection not established"
+            raise RuntimeError(msg)
+        return self._connection
+
+    def _notify_idle(self) -> None:
+        """Schedule the registered idle callbacks."""
+        for callback in self._idle_callbacks:
+            task = asyncio.ensure_future(callback())
+            # Hold a reference until the callback finishes so it is not garbage collected.
+            self._idle_tasks.add(task)
+            task.add_done_callback(self._idle_tasks.discard)
 
     def _build_message(self, message: "EmailMessage") -> StdEmailMessage:
         """Convert EmailMessage to stdlib EmailMessage.
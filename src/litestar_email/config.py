@@ -1,9 +1,13 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from litestar import Litestar
+    from litestar.config.app import AppConfig
     from litestar.datastructures import State
+    from litestar.di import Provide
 
     from litestar_email.backends.base import BaseEmailBackend
     from litestar_email.service import EmailService
@@ -19,6 +23,89 @@ __all__ = (
     "SendGridConfig",
 )
 
+# ``litestar.di.Provide``, resolved on first use by ``_get_provide``
+_Provide: "type[Provide] | None" = None
+
+# Shared signature namespace, built on first use by ``_get_signature_namespace``
+_SIGNATURE_NAMESPACE: "Mapping[str, Any] | None" = None
+
+# ``litestar_email.backends.get_backend``, resolved on first use by ``_get_backend_factory``
+_backend_factory: "Callable[..., BaseEmailBackend] | None" = None
+
+# ``litestar_email.service.EmailService``, resolved on first use by ``_get_email_service``
+_EmailServiceCls: "type[EmailService] | None" = None
+
+
+def _get_provide() -> "type[Provide]":
+    """Return Litestar's ``Provide`` class, importing it only once.
+
+    Returns:
+        The ``litestar.di.Provide`` class.
+    """
+    global _Provide  # noqa: PLW0603
+    if _Provide is None:
+        from litestar.di import Provide
+
+        _Provide = Provide
+    return _Provide
+
+
+def _get_signature_namespace() -> "Mapping[str, Any]":
+    """Return the plugin's signature namespace, building it only once.
+
+    The namespace does not depend on any configuration value, so a single
+    read-only mapping is shared by every ``EmailConfig``.
+
+    Returns:
+        A read-only mapping of names to types for forward reference resolution.
+    """
+    global _SIGNATURE_NAMESPACE  # noqa: PLW0603
+    if _SIGNATURE_NAMESPACE is None:
+        from litestar_email.backends.base import BaseEmailBackend
+        from litestar_email.message import EmailMessage, EmailMultiAlternatives
+        from litestar_email.service import EmailService
+
+        _SIGNATURE_NAMESPACE = MappingProxyType({
+            "BaseEmailBackend": BaseEmailBackend,
+            "EmailConfig": EmailConfig,
+            "EmailMessage": EmailMessage,
+            "EmailMultiAlternatives": EmailMultiAlternatives,
+            "EmailService": EmailService,
+            "MailgunConfig": MailgunConfig,
+            "ResendConfig": ResendConfig,
+            "SMTPConfig": SMTPConfig,
+            "SendGridConfig": SendGridConfig,
+        })
+    return _SIGNATURE_NAMESPACE
+
+
+def _get_backend_factory() -> "Callable[..., BaseEmailBackend]":
+    """Return :func:`litestar_email.backends.get_backend`, importing it only once.
+
+    Returns:
+        The backend factory function.
+    """
+    global _backend_factory  # noqa: PLW0603
+    if _backend_factory is None:
+        from litestar_email.backends import get_backend
+
+        _backend_factory = get_backend
+    return _backend_factory
+
+
+def _get_email_service() -> "type[EmailService]":
+    """Return the :class:`~litestar_email.service.EmailService` class, importing it only once.
+
+    Returns:
+        The ``EmailService`` class.
+    """
+    global _EmailServiceCls  # noqa: PLW0603
+    if _EmailServiceCls is None:
+        from litestar_email.service import EmailService
+
+        _EmailServiceCls = EmailService
+    return _EmailServiceCls
+
 
 class AsyncServiceProvider:
     """Provides EmailService as an async context manager.
@@ -49,9 +136,7 @@ class AsyncServiceProvider:
         Returns:
             An EmailService instance with an open backend connection.
         """
-        from litestar_email.service import EmailService
-
-        self._service = EmailService(self._config)
+        self._service = _get_email_service()(self._config)
         await self._service.__aenter__()
         return self._service
 
@@ -105,6 +190,10 @@ class SMTPConfig:
                 password="secret",
                 use_tls=True,
             )
+
+        Keep five connections open and reuse them across sends::
+
+            config = SMTPConfig(host="smtp.example.com", pool_size=5, max_reuse=100)
     """
 
     host: str = "localhost"
@@ -114,6 +203,9 @@ class SMTPConfig:
     use_tls: bool = False
     use_ssl: bool = False
     timeout: int = 30
+    pool_size: int = 1
+    connection_ttl: float | None = None
+    max_reuse: int | None = None
 
 
 @dataclass(slots=True)
@@ -139,6 +231,15 @@ class ResendConfig:
     api_key: str = ""
     timeout: int = 30
     http_transport: "str | type[HTTPTransport]" = "httpx"
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 75.0
+    max_concurrency: int = 10
+    connect_timeout: float = 5.0
+    read_timeout: float | None = None
+    write_timeout: float = 10.0
+    pool_timeout: float = 5.0
 
 
 @dataclass(slots=True)
@@ -164,6 +265,15 @@ class SendGridConfig:
     api_key: str = ""
     timeout: int = 30
     http_transport: "str | type[HTTPTransport]" = "httpx"
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 75.0
+    max_concurrency: int = 10
+    connect_timeout: float = 5.0
+    read_timeout: float | None = None
+    write_timeout: float = 10.0
+    pool_timeout: float = 5.0
 
 
 @dataclass(slots=True)
@@ -242,6 +352,13 @@ class EmailConfig:
                 backend=ResendConfig(api_key="re_123abc..."),
                 from_email="noreply@example.com",
             )
+
+        Open a fresh backend connection for every request::
+
+            config = EmailConfig(
+                backend=SMTPConfig(host="smtp.example.com", port=587),
+                per_request_service=True,
+            )
     """
 
     backend: str | BackendConfig = "console"
@@ -250,29 +367,17 @@ class EmailConfig:
     fail_silently: bool = False
     email_service_dependency_key: str = "mailer"
     email_service_state_key: str = "mailer"
+    per_request_service: bool = False
+    """Open a new backend connection per request instead of sharing one for the application lifetime."""
 
     @property
-    def signature_namespace(self) -> dict[str, Any]:
+    def signature_namespace(self) -> Mapping[str, Any]:
         """Return the plugin's signature namespace.
 
         Returns:
-            A string keyed dict of names to be added to the namespace for signature forward reference resolution.
+            A string keyed mapping of names to be added to the namespace for signature forward reference resolution.
         """
-        from litestar_email.backends.base import BaseEmailBackend
-        from litestar_email.message import EmailMessage, EmailMultiAlternatives
-        from litestar_email.service import EmailService
-
-        return {
-            "BaseEmailBackend": BaseEmailBackend,
-            "EmailConfig": EmailConfig,
-            "EmailMessage": EmailMessage,
-            "EmailMultiAlternatives": EmailMultiAlternatives,
-            "EmailService": EmailService,
-            "MailgunConfig": MailgunConfig,
-            "ResendConfig": ResendConfig,
-            "SMTPConfig": SMTPConfig,
-            "SendGridConfig": SendGridConfig,
-        }
+        return _get_signature_namespace()
 
     @property
     def dependencies(self) -> dict[str, Any]:
@@ -281,9 +386,69 @@ class EmailConfig:
         Returns:
             A mapping of dependency keys to providers for Litestar's DI system.
         """
-        from litestar.di import Provide
+        return {self.email_service_dependency_key: self._service_provider()}
 
-        return {self.email_service_dependency_key: Provide(self.provide_service, sync_to_thread=False)}
+    def update_app_config(self, app_config: "AppConfig") -> None:
+        """Register this configuration's dependency, signature namespace and state.
+
+        Writes directly into the application config instead of building the
+        intermediate mappings returned by :attr:`dependencies` and
+        :attr:`signature_namespace`.
+
+        Args:
+            app_config: The Litestar application configuration to update.
+        """
+        app_config.dependencies[self.email_service_dependency_key] = self._service_provider()
+        app_config.signature_namespace.update(_get_signature_namespace())
+        app_config.state[self.email_service_state_key] = self
+        if not self.per_request_service:
+            app_config.on_startup.append(self.start_service)
+            app_config.on_shutdown.append(self.stop_service)
+
+    def _service_provider(self) -> "Provide":
+        """Build the DI provider for the email service.
+
+        Returns:
+            A provider yielding the shared application service, or a per-request
+            service when ``per_request_service`` is enabled.
+        """
+        if self.per_request_service:
+            return _get_provide()(self.provide_request_service)
+        return _get_provide()(self.provide_shared_service, sync_to_thread=False)
+
+    async def start_service(self, app: "Litestar") -> None:
+        """Create a long-lived EmailService and store it in the application state.
+
+        Registered as an ``on_startup`` hook unless ``per_request_service`` is set.
+        The backend connection is opened on the first send rather than here, so an
+        unreachable mail server cannot prevent the application from starting; a
+        failed open is retried on the next send.
+
+        Args:
+            app: The Litestar application.
+        """
+        service_cls = _get_email_service()
+        if isinstance(app.state.get(self.email_service_state_key), service_cls):
+            return
+
+        service = service_cls(self)
+        await service.open(lazy=True)
+        app.state[self.email_service_state_key] = service
+
+    async def stop_service(self, app: "Litestar") -> None:
+        """Release the long-lived EmailService created by :meth:`start_service`.
+
+        Args:
+            app: The Litestar application.
+        """
+        service = app.state.get(self.email_service_state_key)
+        if not isinstance(service, _get_email_service()):
+            return
+
+        try:
+            await service.close()
+        finally:
+            app.state[self.email_service_state_key] = self
 
     def get_service(self, state: "State | None" = None) -> "EmailService":
         """Return an EmailService for this configuration.
@@ -294,16 +459,15 @@ class EmailConfig:
         Returns:
             An EmailService instance.
         """
-        from litestar_email.service import EmailService
-
+        service_cls = _get_email_service()
         if state is not None and self.email_service_state_key in state:
             cached = state[self.email_service_state_key]
-            if isinstance(cached, EmailService):
+            if isinstance(cached, service_cls):
                 return cached
             if isinstance(cached, EmailConfig):
-                return EmailService(cached)
+                return service_cls(cached)
 
-        return EmailService(self)
+        return service_cls(self)
 
     def get_backend(
         self,
@@ -317,9 +481,33 @@ class EmailConfig:
         Returns:
             A configured backend instance.
         """
-        from litestar_email.backends import get_backend
+        return _get_backend_factory()(self.backend, fail_silently=fail_silently, config=self)
+
+    def provide_shared_service(self, state: "State") -> "EmailService":
+        """Provide the application-wide EmailService from the app state.
+
+        Used as the DI provider unless ``per_request_service`` is set. Falls back
+        to a standalone service (one backend connection per send) when the shared
+        service has not been started.
 
-        return get_backend(self.backend, fail_silently=fail_silently, config=self)
+        Args:
+            state: The application state.
+
+        Returns:
+            An EmailService instance.
+        """
+        return self.get_service(state)
+
+    async def provide_request_service(self) -> AsyncGenerator["EmailService", None]:
+        """Provide an EmailService with its own backend connection for one request.
+
+        Used as the DI provider when ``per_request_service`` is set.
+
+        Yields:
+            An EmailService instance with an open backend connection.
+        """
+        async with self.provide_service() as service:
+            yield service
 
     def provide_service(self) -> AsyncServiceProvider:
         """Provide an EmailService instance.
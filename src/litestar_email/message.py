@@ -1,3 +1,4 @@
+import base64
 from dataclasses import dataclass, field
 
 __all__ = ("EmailMessage", "EmailMultiAlternatives")
@@ -21,6 +22,8 @@ class EmailMessage:
     headers: dict[str, str] = field(default_factory=dict)
     attachments: list[tuple[str, bytes, str]] = field(default_factory=list)
     alternatives: list[tuple[str, str]] = field(default_factory=list)
+    # Base64 text of attachment content, keyed by id() of the bytes object
+    _base64_cache: dict[int, tuple[bytes, str]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def attach(self, filename: str, content: bytes, mimetype: str) -> None:
         """Add an attachment to the email.
@@ -44,6 +47,26 @@ class EmailMessage:
         """
         self.alternatives.append((content, mimetype))
 
+    def base64_attachments(self) -> list[tuple[str, str, str]]:
+        """Return the attachments with their content base64-encoded.
+
+        Each attachment's content is encoded once and reused on later calls,
+        so a message sent several times (or to several providers) does not
+        re-encode large files.
+
+        Returns:
+            A list of ``(filename, base64_content, mimetype)`` tuples.
+        """
+        encoded: list[tuple[str, str, str]] = []
+        for filename, content, mimetype in self.attachments:
+            cached = self._base64_cache.get(id(content))
+            # Compare identity so a different bytes object reusing a freed id is re-encoded
+            if cached is None or cached[0] is not content:
+                cached = (content, base64.b64encode(content).decode("ascii"))
+                self._base64_cache[id(content)] = cached
+            encoded.append((filename, cached[1], mimetype))
+        return encoded
+
     def recipients(self) -> list[str]:
         """Return all recipients of the email.
 
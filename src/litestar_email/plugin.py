@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 from litestar.plugins import InitPluginProtocol
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from litestar.config.app import AppConfig
     from litestar.datastructures import State
 
@@ -81,7 +83,7 @@ class EmailPlugin(InitPluginProtocol):
                 )
     """
 
-    __slots__ = ("_config",)
+    __slots__ = ("_config", "_get_backend", "_get_service")
 
     def __init__(self, config: "EmailConfig | None" = None) -> None:
         """Initialize the email plugin.
@@ -92,6 +94,9 @@ class EmailPlugin(InitPluginProtocol):
         from litestar_email.config import EmailConfig
 
         self._config = config or EmailConfig()
+        # Bind the config's methods once so delegation skips the attribute chain
+        self._get_service: "Callable[[State | None], EmailService]" = self._config.get_service
+        self._get_backend: "Callable[[bool | None], BaseEmailBackend]" = self._config.get_backend
 
     @property
     def config(self) -> "EmailConfig":
@@ -111,7 +116,7 @@ class EmailPlugin(InitPluginProtocol):
         Returns:
             An EmailService instance.
         """
-        return self._config.get_service(state)
+        return self._get_service(state)
 
     def get_backend(
         self,
@@ -125,7 +130,7 @@ class EmailPlugin(InitPluginProtocol):
         Returns:
             A configured backend instance.
         """
-        return self._config.get_backend(fail_silently=fail_silently)
+        return self._get_backend(fail_silently)
 
     def on_app_init(self, app_config: "AppConfig") -> "AppConfig":
         """Handle application initialization.
@@ -140,7 +145,5 @@ class EmailPlugin(InitPluginProtocol):
         Returns:
             The application configuration (unmodified).
         """
-        app_config.dependencies.update(self._config.dependencies)
-        app_config.signature_namespace.update(self._config.signature_namespace)
-        app_config.state.update({self._config.email_service_state_key: self._config})
+        self._config.update_app_config(app_config)
         return app_config
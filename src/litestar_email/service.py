@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING
 
 from litestar_email.backends import BaseEmailBackend
@@ -6,7 +7,7 @@ if TYPE_CHECKING:
     from litestar_email.config import EmailConfig
     from litestar_email.message import EmailMessage
 
-__all__ = ("EmailService",)
+__all__ = ("EmailService", "send_mass_mail")
 
 
 class EmailService:
@@ -15,9 +16,14 @@ class EmailService:
     This service is intended for dependency injection in handlers. It can also
     be used directly or as an async context manager to reuse connections.
     Outside of a context manager, each send uses a fresh backend instance.
+
+    Holds on the backend connection are counted: nested or concurrent
+    ``async with`` blocks share one connection, which is only closed when the
+    last hold is released. The application-wide service injected by the plugin
+    is held by the application itself, so request code cannot close it.
     """
 
-    __slots__ = ("_backend", "_config")
+    __slots__ = ("_backend", "_config", "_holds", "_open_lock")
 
     def __init__(self, config: "EmailConfig") -> None:
         """Initialize the email service.
@@ -27,6 +33,8 @@ class EmailService:
         """
         self._config = config
         self._backend: BaseEmailBackend | None = None
+        self._holds = 0
+        self._open_lock = asyncio.Lock()
 
     @property
     def config(self) -> "EmailConfig":
@@ -36,8 +44,8 @@ class EmailService:
     def get_backend(self) -> BaseEmailBackend:
         """Return a backend instance for the configured backend name.
 
-        When the service is not in a context manager, this returns a new backend
-        instance each call.
+        Until a held backend has been opened (see :meth:`open`), this returns a
+        new backend instance each call.
         """
         if self._backend is not None:
             return self._backend
@@ -55,8 +63,9 @@ class EmailService:
         if not messages:
             return 0
 
-        if self._backend is not None:
-            return await self._backend.send_messages(messages)
+        if self._holds:
+            backend = await self._open_backend()
+            return await backend.send_messages(messages)
 
         backend = self._config.get_backend()
         try:
@@ -76,10 +85,52 @@ class EmailService:
         """
         return await self.send_messages([message])
 
+    async def open(self, *, lazy: bool = False) -> None:
+        """Take a hold on the backend connection, opening it if needed.
+
+        Every call must be balanced by a call to :meth:`close`.
+
+        Args:
+            lazy: Defer opening the backend until the first send. A failed open
+                is then retried on the next send instead of raising here.
+        """
+        self._holds += 1
+        if lazy:
+            return
+        try:
+            await self._open_backend()
+        except BaseException:
+            self._holds -= 1
+            raise
+
+    async def close(self) -> None:
+        """Release a hold taken by :meth:`open`, closing the backend on the last one."""
+        if not self._holds:
+            return
+        self._holds -= 1
+        if not self._holds and self._backend is not None:
+            backend, self._backend = self._backend, None
+            await backend.close()
+
+    async def _open_backend(self) -> BaseEmailBackend:
+        """Return the held backend, creating and opening it on first use.
+
+        A backend whose ``open()`` failed silently is returned unheld, so it
+        connects for the current send only and the next send retries.
+
+        Returns:
+            The backend to send through.
+        """
+        async with self._open_lock:
+            if self._backend is not None:
+                return self._backend
+            backend = self._config.get_backend()
+            if await backend.open():
+                self._backend = backend
+            return backend
+
     async def __aenter__(self) -> "EmailService":
-        if self._backend is None:
-            self._backend = self._config.get_backend()
-            await self._backend.open()
+        await self.open()
         return self
 
     async def __aexit__(
@@ -88,6 +139,42 @@ class EmailService:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        if self._backend is not None:
-            await self._backend.close()
-            self._backend = None
+        await self.close()
+
+
+async def send_mass_mail(
+    messages: list["EmailMessage"],
+    config: "EmailConfig | None" = None,
+    *,
+    backend: BaseEmailBackend | None = None,
+) -> int:
+    """Send many messages over a single backend connection.
+
+    Args:
+        messages: The email messages to send.
+        config: Email configuration used to create the backend. Ignored when
+            ``backend`` is given; the default backend is used if both are None.
+        backend: An existing backend to send with. If it is already open, its
+            connection is reused and left open.
+
+    Returns:
+        Number of messages sent.
+
+    Example:
+        Send a newsletter::
+
+            sent = await send_mass_mail(messages, config)
+    """
+    if not messages:
+        return 0
+
+    if backend is None:
+        if config is not None:
+            backend = config.get_backend()
+        else:
+            from litestar_email.backends import get_backend
+
+            backend = get_backend()
+
+    async with backend.connection():
+        return await backend.send_messages(messages)
@@ -31,9 +31,14 @@ Example:
             async def __aexit__(self, ...): ...
 
         transport = get_transport(MyTransport)
+
+    Custom transports only receive the ``open()`` options they declare (or all
+    of them if ``open()`` accepts ``**kwargs``), so a transport written for the
+    original ``headers``/``timeout``/``auth``/``base_url`` signature keeps working.
 """
 
-from typing import TYPE_CHECKING
+from inspect import signature
+from typing import TYPE_CHECKING, Any
 
 from litestar_email.transports.base import HTTPResponse, HTTPTransport
 
@@ -49,8 +54,12 @@ __all__ = (
     "HttpxResponse",
     "HttpxTransport",
     "get_transport",
+    "open_transport",
 )
 
+# Per-class ``open`` introspection results: (accepts **kwargs, parameter names)
+_open_signature_cache: dict[type, tuple[bool, frozenset[str]]] = {}
+
 
 def get_transport(transport: str | type["HTTPTransport"] = "httpx") -> "HTTPTransport":
     """Get an HTTP transport instance by name or from a custom class.
@@ -100,6 +109,30 @@ def get_transport(transport: str | type["HTTPTransport"] = "httpx") -> "HTTPTran
     return transport()
 
 
+async def open_transport(transport: "HTTPTransport", **options: Any) -> None:
+    """Open a transport, passing only the options its ``open()`` accepts.
+
+    Options added to :class:`HTTPTransport` after a custom transport was written
+    (``http2``, pool limits, stage timeouts) are dropped for transports that do
+    not declare them, instead of failing with ``TypeError``.
+
+    Args:
+        transport: The transport to open.
+        **options: Keyword arguments for :meth:`HTTPTransport.open`.
+    """
+    transport_class = type(transport)
+    cached = _open_signature_cache.get(transport_class)
+    if cached is None:
+        parameters = signature(transport.open).parameters
+        accepts_kwargs = any(param.kind == param.VAR_KEYWORD for param in parameters.values())
+        cached = _open_signature_cache[transport_class] = (accepts_kwargs, frozenset(parameters))
+
+    accepts_kwargs, accepted = cached
+    if not accepts_kwargs:
+        options = {key: value for key, value in options.items() if key in accepted}
+    await transport.open(**options)
+
+
 def __getattr__(name: str) -> object:
     """Lazy import for transport implementations.
 
@@ -14,6 +14,7 @@ from typing_extensions import Self
 
 from litestar_email.exceptions import EmailConnectionError
 from litestar_email.utils.module_loader import ensure_aiohttp
+from litestar_email.utils.serialization import encode_json
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -25,6 +26,8 @@ __all__ = (
     "AiohttpTransport",
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class AiohttpResponse:
     """Response wrapper for aiohttp responses with lazy body reading.
@@ -155,14 +158,32 @@ class AiohttpTransport:
         timeout: float = 30.0,
         auth: tuple[str, str] | None = None,
         base_url: str | None = None,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
     ) -> None:
         """Initialize the HTTP client session.
 
         Args:
             headers: Default headers for all requests.
-            timeout: Request timeout in seconds.
+            timeout: Total request timeout in seconds.
             auth: HTTP Basic Auth credentials as (username, password).
             base_url: Base URL to prepend to all request URLs.
+            http2: Ignored; aiohttp only speaks HTTP/1.1.
+            max_connections: Total connections across all hosts.
+            max_keepalive_connections: Ignored; aiohttp keeps every idle
+                connection until ``keepalive_expiry`` elapses.
+            keepalive_expiry: How long to keep idle connections (seconds).
+            connect_timeout: Seconds allowed to open a socket connection.
+            read_timeout: Seconds allowed between reads from the socket.
+            write_timeout: Ignored; aiohttp has no write timeout.
+            pool_timeout: Seconds allowed to wait for a pooled connection,
+                added to ``connect_timeout`` for aiohttp's ``connect`` limit.
         """
         if self._session is not None:
             return
@@ -174,13 +195,18 @@ class AiohttpTransport:
         # - limit_per_host: Max connections per host (email APIs are single-host)
         # - keepalive_timeout: How long to keep idle connections
         self._connector = aiohttp.TCPConnector(
-            limit=100,
+            limit=max_connections,
             limit_per_host=10,
-            keepalive_timeout=30.0,
+            keepalive_timeout=keepalive_expiry,
         )
 
         session_kwargs: dict[str, Any] = {
-            "timeout": aiohttp.ClientTimeout(total=timeout),
+            "timeout": aiohttp.ClientTimeout(
+                total=timeout,
+                connect=None if pool_timeout is None or connect_timeout is None else pool_timeout + connect_timeout,
+                sock_connect=connect_timeout,
+                sock_read=read_timeout,
+            ),
             "connector": self._connector,
         }
 
@@ -248,7 +274,7 @@ class AiohttpTransport:
         self,
         url: str,
         *,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | list[Any] | None = None,
         data: dict[str, Any] | None = None,
         files: list[tuple[str, tuple[str, bytes, str]]] | None = None,
     ) -> AiohttpResponse:
@@ -256,7 +282,8 @@ class AiohttpTransport:
 
         Args:
             url: The URL to POST to. May be relative if base_url was set.
-            json: Dictionary to serialize as JSON body.
+            json: Object or array to serialize as JSON body. Encoded with
+                orjson when installed.
             data: Dictionary for form-data body.
             files: List of file tuples for multipart upload.
 
@@ -286,7 +313,8 @@ class AiohttpTransport:
                 request_kwargs["auth"] = self._auth
 
             if json is not None:
-                request_kwargs["json"] = json
+                request_kwargs["data"] = encode_json(json)
+                request_kwargs["headers"] = _JSON_HEADERS
             elif data is not None or files is not None:
                 request_kwargs["data"] = self._build_form_data(data, files)
 
@@ -117,16 +117,35 @@ class HTTPTransport(Protocol):
         timeout: float = 30.0,
         auth: tuple[str, str] | None = None,
         base_url: str | None = None,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
     ) -> None:
         """Initialize the transport with configuration.
 
         Args:
             headers: Default headers to include in all requests.
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds. Used for every stage
+                without its own timeout below.
             auth: HTTP Basic Auth credentials as (username, password).
                 Used by Mailgun for API key authentication.
             base_url: Base URL to prepend to all request URLs.
                 Used by Mailgun for regional endpoint selection.
+            http2: Negotiate HTTP/2 when the transport supports it.
+                Transports without HTTP/2 support ignore this flag.
+            max_connections: Maximum number of concurrent connections.
+            max_keepalive_connections: Maximum number of idle connections kept in the pool.
+            keepalive_expiry: Seconds an idle connection is kept open for reuse.
+            connect_timeout: Seconds allowed to establish a connection, TLS included.
+            read_timeout: Seconds allowed between chunks of the response.
+            write_timeout: Seconds allowed between chunks of the request.
+            pool_timeout: Seconds allowed to wait for a free pooled connection.
+                Transports without a stage-specific setting ignore it.
         """
         ...
 
@@ -138,7 +157,7 @@ class HTTPTransport(Protocol):
         self,
         url: str,
         *,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | list[Any] | None = None,
         data: dict[str, Any] | None = None,
         files: list[tuple[str, tuple[str, bytes, str]]] | None = None,
     ) -> HTTPResponse:
@@ -150,7 +169,7 @@ class HTTPTransport(Protocol):
 
         Args:
             url: The URL to POST to. May be relative if base_url was set.
-            json: Dictionary to serialize as JSON body. Mutually exclusive with data.
+            json: Object or array to serialize as JSON body. Mutually exclusive with data.
             data: Dictionary for form-data body. Used with files for multipart requests.
             files: List of file tuples for multipart upload.
                 Each tuple is (field_name, (filename, content, content_type)).
@@ -9,7 +9,9 @@ from typing import TYPE_CHECKING, Any, cast
 from typing_extensions import Self
 
 from litestar_email.exceptions import EmailConnectionError
+from litestar_email.utils.dependencies import module_available
 from litestar_email.utils.module_loader import ensure_httpx
+from litestar_email.utils.serialization import encode_json
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -21,6 +23,8 @@ __all__ = (
     "HttpxTransport",
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class HttpxResponse:
     """Response wrapper for httpx responses.
@@ -80,8 +84,9 @@ class HttpxTransport:
     It provides async HTTP operations with automatic connection pooling.
 
     Connection pooling is handled automatically by httpx.AsyncClient:
-    - Default: 100 max connections, 10 per host
-    - Keep-alive enabled by default
+    - Default: 100 max connections, 20 kept alive for 30 seconds
+    - Pool sizing and keep-alive are configurable through ``open()``
+    - HTTP/2 is used when requested and ``h2`` is installed
     - Connections are reused across multiple requests within a session
 
     Supports both JSON APIs (Resend, SendGrid) and form-data APIs (Mailgun)
@@ -134,33 +139,53 @@ class HttpxTransport:
         timeout: float = 30.0,
         auth: tuple[str, str] | None = None,
         base_url: str | None = None,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
     ) -> None:
         """Initialize the HTTP client.
 
         Args:
             headers: Default headers for all requests.
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds, used for every stage
+                without its own timeout below.
             auth: HTTP Basic Auth credentials as (username, password).
             base_url: Base URL to prepend to all request URLs.
+            http2: Negotiate HTTP/2. Only honoured when the ``h2`` package is
+                installed; otherwise the client stays on HTTP/1.1.
+            max_connections: Total connections across all hosts.
+            max_keepalive_connections: Idle connections kept alive in the pool.
+            keepalive_expiry: How long to keep idle connections (seconds).
+            connect_timeout: Seconds allowed to establish a connection.
+            read_timeout: Seconds allowed between chunks of the response.
+            write_timeout: Seconds allowed between chunks of the request.
+            pool_timeout: Seconds allowed to wait for a pooled connection.
         """
         if self._client is not None:
             return
 
         import httpx
 
-        # Configure connection pool limits for email API workloads
-        # - max_connections: Total connections across all hosts
-        # - max_keepalive_connections: Connections to keep alive in pool
-        # - keepalive_expiry: How long to keep idle connections (seconds)
         limits = httpx.Limits(
-            max_connections=100,
-            max_keepalive_connections=20,
-            keepalive_expiry=30.0,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
 
         client_kwargs: dict[str, Any] = {
-            "timeout": timeout,
+            "timeout": httpx.Timeout(
+                connect=timeout if connect_timeout is None else connect_timeout,
+                read=timeout if read_timeout is None else read_timeout,
+                write=timeout if write_timeout is None else write_timeout,
+                pool=timeout if pool_timeout is None else pool_timeout,
+            ),
             "limits": limits,
+            "http2": http2 and module_available("h2"),
         }
 
         if headers:
@@ -184,7 +209,7 @@ class HttpxTransport:
         self,
         url: str,
         *,
-        json: dict[str, Any] | None = None,
+        json: dict[str, Any] | list[Any] | None = None,
         data: dict[str, Any] | None = None,
         files: list[tuple[str, tuple[str, bytes, str]]] | None = None,
     ) -> HttpxResponse:
@@ -192,7 +217,8 @@ class HttpxTransport:
 
         Args:
             url: The URL to POST to.
-            json: Dictionary to serialize as JSON body.
+            json: Object or array to serialize as JSON body. Encoded with
+                orjson when installed.
             data: Dictionary for form-data body.
             files: List of file tuples for multipart upload.
 
@@ -210,7 +236,10 @@ class HttpxTransport:
         import httpx
 
         try:
-            response = await self._client.post(url, json=json, data=data, files=files)
+            if json is not None:
+                response = await self._client.post(url, content=encode_json(json), headers=_JSON_HEADERS)
+            else:
+                response = await self._client.post(url, data=data, files=files)
             return HttpxResponse(response)
         except httpx.ConnectError as exc:
             msg = f"Connection failed: {exc}"
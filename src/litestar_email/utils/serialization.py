@@ -0,0 +1,70 @@
+"""JSON encoding for HTTP request bodies.
+
+API-based backends hand their payloads to the HTTP transports, which encode
+them with :func:`encode_json`. The encoder is picked in order of preference:
+``orjson`` when the ``orjson`` extra is installed, then ``msgspec`` (a
+Litestar dependency, so normally present), then the standard library
+``json`` module. All of them produce compact UTF-8 bytes that can be sent as
+the request body.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from litestar_email.utils.dependencies import dependency_flag
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = (
+    "HAS_MSGSPEC",
+    "HAS_ORJSON",
+    "encode_json",
+)
+
+HAS_ORJSON = dependency_flag("orjson")
+HAS_MSGSPEC = dependency_flag("msgspec")
+
+# Encoder chosen on first use, so the availability checks and import
+# happen once rather than per request.
+_encoder: "Callable[[Any], bytes] | None" = None
+
+
+def _load_encoder() -> "Callable[[Any], bytes]":
+    """Return the fastest available JSON encoder.
+
+    Returns:
+        A callable that serializes an object to UTF-8 encoded JSON bytes.
+    """
+    if HAS_ORJSON:
+        import orjson
+
+        return orjson.dumps
+
+    if HAS_MSGSPEC:
+        import msgspec
+
+        return msgspec.json.Encoder().encode
+
+    import json
+
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def _dumps(obj: Any) -> bytes:
+        return encoder.encode(obj).encode("utf-8")
+
+    return _dumps
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes.
+
+    Args:
+        obj: A JSON-serializable object (dicts, lists, strings, numbers, ...).
+
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    global _encoder  # noqa: PLW0603
+    if _encoder is None:
+        _encoder = _load_encoder()
+    return _encoder(obj)
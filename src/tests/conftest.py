@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
+    import respx
     from litestar import Litestar
 
     from litestar_email import EmailConfig, EmailPlugin
@@ -42,3 +43,30 @@ def app(email_plugin: "EmailPlugin") -> "Litestar":
     from litestar import Litestar
 
     return Litestar(plugins=[email_plugin])
+
+
+@pytest.fixture
+def resend_route(respx_mock: "respx.MockRouter") -> "respx.Route":
+    """Return a mocked route for the Resend send endpoint.
+
+    Tests set the response with ``resend_route.mock(return_value=...)``.
+    """
+    from litestar_email.backends.resend import RESEND_API_URL
+
+    return respx_mock.post(RESEND_API_URL)
+
+
+@pytest.fixture
+def sendgrid_route(respx_mock: "respx.MockRouter") -> "respx.Route":
+    """Return a mocked route for the SendGrid mail/send endpoint."""
+    from litestar_email.backends.sendgrid import SENDGRID_API_URL
+
+    return respx_mock.post(SENDGRID_API_URL)
+
+
+@pytest.fixture
+def mailgun_route(respx_mock: "respx.MockRouter") -> "respx.Route":
+    """Return a mocked route for the Mailgun US messages endpoint of ``mg.example.com``."""
+    from litestar_email.backends.mailgun import MAILGUN_US_URL
+
+    return respx_mock.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages")
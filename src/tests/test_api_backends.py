@@ -1,12 +1,55 @@
 """Tests for API-based email backends (Resend, SendGrid, Mailgun)."""
 
+import asyncio
+import contextlib
+from typing import Any, NamedTuple
+from urllib.parse import unquote
+
 import httpx
+import msgspec
 import pytest
 import respx
 
+from litestar_email import EmailConfig, EmailMessage, get_backend, list_backends
+from litestar_email.backends.mailgun import MAILGUN_EU_URL, MailgunBackend
+from litestar_email.backends.resend import RESEND_BATCH_API_URL, RESEND_BATCH_LIMIT, ResendBackend
+from litestar_email.backends.sendgrid import SENDGRID_MAX_RECIPIENTS, SendGridBackend
+from litestar_email.backends.smtp import SMTPBackend
+from litestar_email.config import MailgunConfig, ResendConfig, SendGridConfig, SMTPConfig
+from litestar_email.exceptions import EmailDeliveryError, EmailRateLimitError, MissingDependencyError
+from litestar_email.transports import HTTPTransport
+from litestar_email.utils import dependencies
+
 pytestmark = pytest.mark.anyio
 
 
+def last_payload(route: respx.Route) -> Any:
+    """Decode the JSON body of the last request sent to a mocked route.
+
+    Args:
+        route: The respx route that received the request.
+
+    Returns:
+        The decoded JSON payload.
+    """
+    return msgspec.json.decode(route.calls.last.request.content)
+
+
+def current_transport(backend: ResendBackend | SendGridBackend | MailgunBackend) -> HTTPTransport | None:
+    """Return the backend's open transport.
+
+    Reading through a call keeps mypy from carrying an earlier narrowing of
+    ``backend._transport`` past code that opens or closes the backend.
+
+    Args:
+        backend: The API backend under test.
+
+    Returns:
+        The open transport, or None when the backend is closed.
+    """
+    return backend._transport
+
+
 # ==============================================================================
 # Resend Backend Tests
 # ==============================================================================
@@ -14,15 +57,10 @@ pytestmark = pytest.mark.anyio
 
 def test_resend_backend_requires_httpx(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that ResendBackend raises MissingDependencyError if httpx is not installed."""
-    from litestar_email.exceptions import MissingDependencyError
-    from litestar_email.utils import dependencies
-
     # Mock module_available to return False for httpx
     monkeypatch.setattr(dependencies, "_dependency_cache", {"httpx": False})
 
     with pytest.raises(MissingDependencyError, match="httpx"):
-        from litestar_email.backends.resend import ResendBackend
-
         ResendBackend()
 
     # Restore cache
@@ -31,8 +69,6 @@ def test_resend_backend_requires_httpx(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_resend_backend_default_config() -> None:
     """Test ResendBackend uses default config when none provided."""
-    from litestar_email.backends.resend import ResendBackend
-
     backend = ResendBackend()
     assert backend._config.api_key == ""
     assert backend._config.timeout == 30
@@ -40,9 +76,6 @@ def test_resend_backend_default_config() -> None:
 
 def test_resend_backend_custom_config() -> None:
     """Test ResendBackend accepts custom config."""
-    from litestar_email.backends.resend import ResendBackend
-    from litestar_email.config import ResendConfig
-
     config = ResendConfig(api_key="re_xxx", timeout=60)
     backend = ResendBackend(config=config)
     assert backend._config.api_key == "re_xxx"
@@ -51,14 +84,9 @@ def test_resend_backend_custom_config() -> None:
 
 async def test_resend_backend_open_returns_false_when_connected() -> None:
     """Test that open() returns False if already connected."""
-    from unittest.mock import MagicMock
-
-    from litestar_email.backends.resend import ResendBackend
-    from litestar_email.config import ResendConfig
-
     config = ResendConfig(api_key="re_xxx")
     backend = ResendBackend(config=config)
-    backend._transport = MagicMock()
+    backend._transport = object()  # type: ignore[assignment]
 
     result = await backend.open()
     assert result is False
@@ -66,9 +94,6 @@ async def test_resend_backend_open_returns_false_when_connected() -> None:
 
 async def test_resend_backend_open_creates_transport() -> None:
     """Test that open() creates a new HTTP transport."""
-    from litestar_email.backends.resend import ResendBackend
-    from litestar_email.config import ResendConfig
-
     config = ResendConfig(api_key="re_xxx")
     backend = ResendBackend(config=config)
 
@@ -79,70 +104,118 @@ async def test_resend_backend_open_creates_transport() -> None:
     await backend.close()
 
 
-async def test_resend_backend_close_when_not_connected() -> None:
-    """Test that close() does nothing when not connected."""
-    from litestar_email.backends.resend import ResendBackend
+async def test_resend_backend_open_passes_pool_settings() -> None:
+    """Test that open() forwards HTTP/2, pool and timeout settings to the transport."""
+    opened: dict[str, Any] = {}
 
-    backend = ResendBackend()
-    backend._transport = None
+    class RecordingTransport:
+        async def open(self, **kwargs: Any) -> None:
+            opened.update(kwargs)
 
-    # Should not raise
+        async def close(self) -> None:
+            pass
+
+    config = ResendConfig(
+        api_key="re_xxx",
+        http_transport=RecordingTransport,  # type: ignore[arg-type]
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=120.0,
+        read_timeout=45.0,
+    )
+    backend = ResendBackend(config=config)
+
+    await backend.open()
     await backend.close()
 
+    assert opened["headers"]["Authorization"] == "Bearer re_xxx"
+    assert opened["headers"]["User-Agent"].startswith("litestar-email")
+    assert opened["http2"] is True
+    assert opened["max_connections"] == 10
+    assert opened["max_keepalive_connections"] == 5
+    assert opened["keepalive_expiry"] == 120.0
+    assert opened["timeout"] == 30.0
+    assert opened["connect_timeout"] == 5.0
+    assert opened["read_timeout"] == 45.0
+    assert opened["write_timeout"] == 10.0
+    assert opened["pool_timeout"] == 5.0
+
+
+@pytest.mark.parametrize(
+    "backend_class, config_class",
+    [(ResendBackend, ResendConfig), (SendGridBackend, SendGridConfig)],
+)
+async def test_backend_open_supports_original_transport_signature(
+    backend_class: type[ResendBackend | SendGridBackend],
+    config_class: type[ResendConfig | SendGridConfig],
+) -> None:
+    """Test a custom transport without the HTTP/2, pool or timeout options still opens."""
+    opened: dict[str, Any] = {}
+
+    class OriginalTransport:
+        async def open(
+            self,
+            headers: dict[str, str] | None = None,
+            timeout: float = 30.0,
+            auth: tuple[str, str] | None = None,
+            base_url: str | None = None,
+        ) -> None:
+            opened.update(headers=headers, timeout=timeout, auth=auth, base_url=base_url)
+
+        async def close(self) -> None:
+            pass
+
+    backend = backend_class(config=config_class(api_key="key", http_transport=OriginalTransport))  # type: ignore[arg-type]
+
+    assert await backend.open() is True
+    await backend.close()
 
-async def test_resend_backend_send_empty_list() -> None:
-    """Test sending empty list returns 0."""
-    from litestar_email.backends.resend import ResendBackend
+    assert opened["headers"]["Authorization"] == "Bearer key"
+    assert opened["timeout"] == 30.0
 
-    backend = ResendBackend()
-    count = await backend.send_messages([])
-    assert count == 0
 
+async def test_backend_connection_reuse(resend_route: respx.Route) -> None:
+    """Test connection() keeps one transport open across send_messages calls."""
+    route = resend_route.mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
 
-async def test_resend_backend_send_message_not_connected() -> None:
-    """Test _send_message raises if not connected."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.resend import ResendBackend
+    backend = ResendBackend(config=ResendConfig(api_key="re_xxx"))
+    message = EmailMessage(subject="Test", body="Body", from_email="sender@example.com", to=["to@example.com"])
 
-    backend = ResendBackend()
-    backend._transport = None
-    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    async with backend.connection():
+        transport = current_transport(backend)
+        assert transport is not None
 
-    with pytest.raises(RuntimeError, match="Resend transport not initialized"):
-        await backend._send_message(message)
+        await backend.send_messages([message])
+        async with backend.connection():
+            await backend.send_messages([message])
 
+        assert current_transport(backend) is transport
 
-@respx.mock
-async def test_resend_backend_send_success() -> None:
-    """Test successful email sending via Resend API."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.resend import RESEND_API_URL, ResendBackend
-    from litestar_email.config import ResendConfig
+    assert current_transport(backend) is None
+    assert route.call_count == 2
 
-    respx.post(RESEND_API_URL).mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
 
-    config = ResendConfig(api_key="re_xxx")
-    backend = ResendBackend(config=config)
+async def test_resend_backend_close_when_not_connected() -> None:
+    """Test that close() does nothing when not connected."""
+    backend = ResendBackend()
+    backend._transport = None
 
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        from_email="sender@example.com",
-        to=["test@example.com"],
-    )
+    # Should not raise
+    await backend.close()
 
-    count = await backend.send_messages([message])
-    assert count == 1
 
+async def test_resend_backend_send_empty_list(respx_mock: respx.MockRouter) -> None:
+    """Test sending empty list returns 0 without opening a transport."""
+    backend = ResendBackend()
+    count = await backend.send_messages([])
+    assert count == 0
+    assert backend._transport is None
+    assert respx_mock.calls.call_count == 0
 
-@respx.mock
-async def test_resend_backend_send_with_all_fields() -> None:
-    """Test sending email with all optional fields."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.resend import RESEND_API_URL, ResendBackend
-    from litestar_email.config import ResendConfig
 
-    route = respx.post(RESEND_API_URL).mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
+async def test_resend_backend_send_with_all_fields(resend_route: respx.Route) -> None:
+    """Test sending email with all optional fields."""
+    route = resend_route.mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
 
     config = ResendConfig(api_key="re_xxx")
     backend = ResendBackend(config=config)
@@ -164,10 +237,7 @@ async def test_resend_backend_send_with_all_fields() -> None:
     assert count == 1
 
     # Verify request payload
-    request = route.calls.last.request
-    import json
-
-    payload = json.loads(request.content)
+    payload = last_payload(route)
 
     assert payload["from"] == "sender@example.com"
     assert payload["to"] == ["test@example.com"]
@@ -181,14 +251,9 @@ async def test_resend_backend_send_with_all_fields() -> None:
     assert payload["attachments"][0]["filename"] == "file.txt"
 
 
-@respx.mock
-async def test_resend_backend_uses_default_from() -> None:
+async def test_resend_backend_uses_default_from(resend_route: respx.Route) -> None:
     """Test default from values are used when message lacks from_email."""
-    from litestar_email import EmailConfig, EmailMessage
-    from litestar_email.backends.resend import RESEND_API_URL
-    from litestar_email.config import ResendConfig
-
-    route = respx.post(RESEND_API_URL).mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
+    route = resend_route.mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
 
     config = EmailConfig(
         backend=ResendConfig(api_key="re_xxx"),
@@ -205,85 +270,91 @@ async def test_resend_backend_uses_default_from() -> None:
 
     await backend.send_messages([message])
 
-    import json
-
-    payload = json.loads(route.calls.last.request.content)
+    payload = last_payload(route)
     assert payload["from"] == "Litestar <noreply@example.com>"
 
 
-@respx.mock
-async def test_resend_backend_rate_limit() -> None:
-    """Test rate limit error handling."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.resend import RESEND_API_URL, ResendBackend
-    from litestar_email.config import ResendConfig
-    from litestar_email.exceptions import EmailRateLimitError
-
-    respx.post(RESEND_API_URL).mock(return_value=httpx.Response(429, headers={"Retry-After": "60"}))
+async def test_resend_backend_multiple_reply_to(resend_route: respx.Route) -> None:
+    """Test multiple reply-to addresses are handled correctly."""
+    route = resend_route.mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
 
     config = ResendConfig(api_key="re_xxx")
-    backend = ResendBackend(config=config, fail_silently=False)
+    backend = ResendBackend(config=config)
 
     message = EmailMessage(
         subject="Test",
         body="Body",
         to=["test@example.com"],
+        reply_to=["reply1@example.com", "reply2@example.com"],
     )
 
-    with pytest.raises(EmailRateLimitError) as exc_info:
-        await backend.send_messages([message])
+    await backend.send_messages([message])
 
-    assert exc_info.value.retry_after == 60
+    payload = last_payload(route)
+    assert payload["reply_to"] == ["reply1@example.com", "reply2@example.com"]
 
 
-@respx.mock
-async def test_resend_backend_api_error() -> None:
-    """Test API error handling."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.resend import RESEND_API_URL, ResendBackend
-    from litestar_email.config import ResendConfig
-    from litestar_email.exceptions import EmailDeliveryError
+async def test_resend_backend_send_batch(respx_mock: respx.MockRouter, resend_route: respx.Route) -> None:
+    """Test multiple messages are sent in a single batch request."""
+    batch_route = respx_mock.post(RESEND_BATCH_API_URL).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "msg_1"}, {"id": "msg_2"}]})
+    )
+    single_route = resend_route.mock(return_value=httpx.Response(200, json={"id": "msg_3"}))
 
-    respx.post(RESEND_API_URL).mock(return_value=httpx.Response(400, json={"message": "Invalid request"}))
+    backend = ResendBackend(config=ResendConfig(api_key="re_xxx"))
 
-    config = ResendConfig(api_key="re_xxx")
-    backend = ResendBackend(config=config, fail_silently=False)
+    first = EmailMessage(subject="First", body="Body", from_email="a@example.com", to=["one@example.com"])
+    second = EmailMessage(subject="Second", body="Body", from_email="b@example.com", to=["two@example.com"])
+    with_attachment = EmailMessage(subject="Third", body="Body", from_email="a@example.com", to=["three@example.com"])
+    with_attachment.attach("file.txt", b"content", "text/plain")
 
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-    )
+    count = await backend.send_messages([first, second, with_attachment])
+    assert count == 3
 
-    with pytest.raises(EmailDeliveryError, match="Failed to send email"):
-        await backend.send_messages([message])
+    assert batch_route.call_count == 1
+    payload = last_payload(batch_route)
+    assert [item["subject"] for item in payload] == ["First", "Second"]
+    assert [item["from"] for item in payload] == ["a@example.com", "b@example.com"]
 
+    # The batch endpoint does not support attachments
+    assert single_route.call_count == 1
+    assert last_payload(single_route)["subject"] == "Third"
 
-@respx.mock
-async def test_resend_backend_multiple_reply_to() -> None:
-    """Test multiple reply-to addresses are handled correctly."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.resend import RESEND_API_URL, ResendBackend
-    from litestar_email.config import ResendConfig
 
-    route = respx.post(RESEND_API_URL).mock(return_value=httpx.Response(200, json={"id": "msg_123"}))
+async def test_resend_backend_send_batch_splits_at_limit(respx_mock: respx.MockRouter) -> None:
+    """Test batches larger than RESEND_BATCH_LIMIT are split into several batch requests."""
+    batch_route = respx_mock.post(RESEND_BATCH_API_URL).mock(return_value=httpx.Response(200, json={"data": []}))
 
-    config = ResendConfig(api_key="re_xxx")
-    backend = ResendBackend(config=config)
+    backend = ResendBackend(config=ResendConfig(api_key="re_xxx"))
+    messages = [
+        EmailMessage(subject=f"Test {index}", body="Body", from_email="a@example.com", to=["to@example.com"])
+        for index in range(RESEND_BATCH_LIMIT + 1)
+    ]
 
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-        reply_to=["reply1@example.com", "reply2@example.com"],
-    )
+    count = await backend.send_messages(messages)
 
-    await backend.send_messages([message])
+    assert count == RESEND_BATCH_LIMIT + 1
+    assert batch_route.call_count == 2
+    sizes = [len(msgspec.json.decode(call.request.content)) for call in batch_route.calls]
+    assert sizes == [RESEND_BATCH_LIMIT, 1]
 
-    import json
 
-    payload = json.loads(route.calls.last.request.content)
-    assert payload["reply_to"] == ["reply1@example.com", "reply2@example.com"]
+@pytest.mark.parametrize("fail_silently", [False, True])
+async def test_resend_backend_send_batch_error(respx_mock: respx.MockRouter, fail_silently: bool) -> None:
+    """Test a rejected batch raises EmailDeliveryError, or counts nothing when failing silently."""
+    respx_mock.post(RESEND_BATCH_API_URL).mock(return_value=httpx.Response(500, text="Internal Server Error"))
+
+    backend = ResendBackend(config=ResendConfig(api_key="re_xxx"), fail_silently=fail_silently)
+    messages = [
+        EmailMessage(subject="Test", body="Body", from_email="a@example.com", to=[f"user{index}@example.com"])
+        for index in range(2)
+    ]
+
+    if fail_silently:
+        assert await backend.send_messages(messages) == 0
+    else:
+        with pytest.raises(EmailDeliveryError, match="Failed to send batch of 2 emails via Resend"):
+            await backend.send_messages(messages)
 
 
 # ==============================================================================
@@ -293,15 +364,10 @@ async def test_resend_backend_multiple_reply_to() -> None:
 
 def test_sendgrid_backend_requires_httpx(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that SendGridBackend raises MissingDependencyError if httpx is not installed."""
-    from litestar_email.exceptions import MissingDependencyError
-    from litestar_email.utils import dependencies
-
     # Mock module_available to return False for httpx
     monkeypatch.setattr(dependencies, "_dependency_cache", {"httpx": False})
 
     with pytest.raises(MissingDependencyError, match="httpx"):
-        from litestar_email.backends.sendgrid import SendGridBackend
-
         SendGridBackend()
 
     # Restore cache
@@ -310,8 +376,6 @@ def test_sendgrid_backend_requires_httpx(monkeypatch: pytest.MonkeyPatch) -> Non
 
 def test_sendgrid_backend_default_config() -> None:
     """Test SendGridBackend uses default config when none provided."""
-    from litestar_email.backends.sendgrid import SendGridBackend
-
     backend = SendGridBackend()
     assert backend._config.api_key == ""
     assert backend._config.timeout == 30
@@ -319,9 +383,6 @@ def test_sendgrid_backend_default_config() -> None:
 
 def test_sendgrid_backend_custom_config() -> None:
     """Test SendGridBackend accepts custom config."""
-    from litestar_email.backends.sendgrid import SendGridBackend
-    from litestar_email.config import SendGridConfig
-
     config = SendGridConfig(api_key="SG.xxx", timeout=60)
     backend = SendGridBackend(config=config)
     assert backend._config.api_key == "SG.xxx"
@@ -330,72 +391,26 @@ def test_sendgrid_backend_custom_config() -> None:
 
 async def test_sendgrid_backend_open_returns_false_when_connected() -> None:
     """Test that open() returns False if already connected."""
-    from unittest.mock import MagicMock
-
-    from litestar_email.backends.sendgrid import SendGridBackend
-    from litestar_email.config import SendGridConfig
-
     config = SendGridConfig(api_key="SG.xxx")
     backend = SendGridBackend(config=config)
-    backend._transport = MagicMock()
+    backend._transport = object()  # type: ignore[assignment]
 
     result = await backend.open()
     assert result is False
 
 
-async def test_sendgrid_backend_send_empty_list() -> None:
-    """Test sending empty list returns 0."""
-    from litestar_email.backends.sendgrid import SendGridBackend
-
+async def test_sendgrid_backend_send_empty_list(respx_mock: respx.MockRouter) -> None:
+    """Test sending empty list returns 0 without opening a transport."""
     backend = SendGridBackend()
     count = await backend.send_messages([])
     assert count == 0
+    assert backend._transport is None
+    assert respx_mock.calls.call_count == 0
 
 
-async def test_sendgrid_backend_send_message_not_connected() -> None:
-    """Test _send_message raises if not connected."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.sendgrid import SendGridBackend
-
-    backend = SendGridBackend()
-    backend._transport = None
-    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
-
-    with pytest.raises(RuntimeError, match="SendGrid transport not initialized"):
-        await backend._send_message(message)
-
-
-@respx.mock
-async def test_sendgrid_backend_send_success() -> None:
-    """Test successful email sending via SendGrid API."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.sendgrid import SENDGRID_API_URL, SendGridBackend
-    from litestar_email.config import SendGridConfig
-
-    respx.post(SENDGRID_API_URL).mock(return_value=httpx.Response(202))
-
-    config = SendGridConfig(api_key="SG.xxx")
-    backend = SendGridBackend(config=config)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        from_email="sender@example.com",
-        to=["test@example.com"],
-    )
-
-    count = await backend.send_messages([message])
-    assert count == 1
-
-
-@respx.mock
-async def test_sendgrid_backend_send_with_all_fields() -> None:
+async def test_sendgrid_backend_send_with_all_fields(sendgrid_route: respx.Route) -> None:
     """Test sending email with all optional fields."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.sendgrid import SENDGRID_API_URL, SendGridBackend
-    from litestar_email.config import SendGridConfig
-
-    route = respx.post(SENDGRID_API_URL).mock(return_value=httpx.Response(202))
+    route = sendgrid_route.mock(return_value=httpx.Response(202))
 
     config = SendGridConfig(api_key="SG.xxx")
     backend = SendGridBackend(config=config)
@@ -417,9 +432,8 @@ async def test_sendgrid_backend_send_with_all_fields() -> None:
     assert count == 1
 
     # Verify request payload matches SendGrid v3 format
-    import json
 
-    payload = json.loads(route.calls.last.request.content)
+    payload = last_payload(route)
 
     assert payload["from"]["email"] == "sender@example.com"
     assert payload["subject"] == "Test"
@@ -442,14 +456,201 @@ async def test_sendgrid_backend_send_with_all_fields() -> None:
     assert payload["attachments"][0]["type"] == "text/plain"
 
 
-@respx.mock
-async def test_sendgrid_backend_uses_default_from() -> None:
-    """Test default from values are used when message lacks from_email."""
-    from litestar_email import EmailConfig, EmailMessage
-    from litestar_email.backends.sendgrid import SENDGRID_API_URL
-    from litestar_email.config import SendGridConfig
+async def test_sendgrid_backend_send_batch(sendgrid_route: respx.Route) -> None:
+    """Test messages sharing an envelope are sent as one request with several personalizations."""
+    route = sendgrid_route.mock(return_value=httpx.Response(202))
+
+    backend = SendGridBackend(config=SendGridConfig(api_key="SG.xxx"))
+
+    messages = [
+        EmailMessage(
+            subject=f"Hello {index}",
+            body="Plain text",
+            from_email="sender@example.com",
+            to=[f"user{index}@example.com"],
+            headers={"X-Index": str(index)},
+        )
+        for index in range(3)
+    ]
+    messages[0].cc = ["cc@example.com"]
+
+    count = await backend.send_messages(messages)
+    assert count == 3
+    assert route.call_count == 1
+
+    payload = last_payload(route)
+    assert payload["from"] == {"email": "sender@example.com"}
+    assert payload["content"] == [{"type": "text/plain", "value": "Plain text"}]
+    assert "headers" not in payload
+    assert payload["personalizations"] == [
+        {
+            "to": [{"email": "user0@example.com"}],
+            "cc": [{"email": "cc@example.com"}],
+            "subject": "Hello 0",
+            "headers": {"X-Index": "0"},
+        },
+        {"to": [{"email": "user1@example.com"}], "subject": "Hello 1", "headers": {"X-Index": "1"}},
+        {"to": [{"email": "user2@example.com"}], "subject": "Hello 2", "headers": {"X-Index": "2"}},
+    ]
+
+
+async def test_sendgrid_backend_send_batch_splits_at_recipient_limit(sendgrid_route: respx.Route) -> None:
+    """Test a batch over SENDGRID_MAX_RECIPIENTS is split into requests under the cap."""
+    route = sendgrid_route.mock(return_value=httpx.Response(202))
+
+    backend = SendGridBackend(config=SendGridConfig(api_key="SG.xxx"))
+    # Three messages of 400 recipients each: 1200 in total
+    messages = [
+        EmailMessage(
+            subject="Test",
+            body="Body",
+            from_email="sender@example.com",
+            to=[f"user{index}@example.com"],
+            bcc=[f"bcc{index}-{n}@example.com" for n in range(399)],
+        )
+        for index in range(3)
+    ]
+
+    count = await backend.send_messages(messages)
+
+    assert count == 3
+    assert route.call_count == 2
+    recipient_counts = [
+        sum(
+            len(personalization["to"]) + len(personalization.get("bcc", []))
+            for personalization in msgspec.json.decode(call.request.content)["personalizations"]
+        )
+        for call in route.calls
+    ]
+    assert recipient_counts == [800, 400]
+    assert all(total <= SENDGRID_MAX_RECIPIENTS for total in recipient_counts)
+
+
+@pytest.mark.parametrize("fail_silently", [False, True])
+async def test_sendgrid_backend_send_batch_error(sendgrid_route: respx.Route, fail_silently: bool) -> None:
+    """Test a rejected batch raises EmailDeliveryError, or counts nothing when failing silently."""
+    sendgrid_route.mock(return_value=httpx.Response(400, text="Bad Request"))
+
+    backend = SendGridBackend(config=SendGridConfig(api_key="SG.xxx"), fail_silently=fail_silently)
+    messages = [
+        EmailMessage(subject="Test", body="Body", from_email="sender@example.com", to=[f"user{index}@example.com"])
+        for index in range(2)
+    ]
+
+    if fail_silently:
+        assert await backend.send_messages(messages) == 0
+    else:
+        with pytest.raises(EmailDeliveryError, match="Failed to send batch of 2 emails via SendGrid"):
+            await backend.send_messages(messages)
+
+
+def test_sendgrid_backend_reuses_recipient_objects() -> None:
+    """Test repeated recipient addresses share one cached email object."""
+    messages = [
+        EmailMessage(subject="Hello", body="Body", to=["user@example.com"], cc=["team@example.com"]),
+        EmailMessage(subject="Hello", body="Body", to=["other@example.com"], bcc=["team@example.com"]),
+    ]
+
+    first, second = (SendGridBackend._encode_personalization(message) for message in messages)
+
+    assert first["cc"] == [{"email": "team@example.com"}]
+    assert first["cc"][0] is second["bcc"][0]
+
+
+async def test_sendgrid_backend_batch_falls_back_for_different_senders(sendgrid_route: respx.Route) -> None:
+    """Test messages with different senders are sent as separate requests."""
+    route = sendgrid_route.mock(return_value=httpx.Response(202))
+
+    backend = SendGridBackend(config=SendGridConfig(api_key="SG.xxx"))
 
-    route = respx.post(SENDGRID_API_URL).mock(return_value=httpx.Response(202))
+    messages = [
+        EmailMessage(subject="Test", body="Body", from_email="a@example.com", to=["one@example.com"]),
+        EmailMessage(subject="Test", body="Body", from_email="b@example.com", to=["two@example.com"]),
+    ]
+
+    count = await backend.send_messages(messages)
+    assert count == 2
+    assert route.call_count == 2
+
+    senders = [msgspec.json.decode(call.request.content)["from"]["email"] for call in route.calls]
+    assert senders == ["a@example.com", "b@example.com"]
+
+
+async def test_sendgrid_backend_sends_unbatched_messages_concurrently(sendgrid_route: respx.Route) -> None:
+    """Test messages that cannot be batched are sent in parallel, up to max_concurrency at once."""
+    max_concurrency = 3
+    in_flight = 0
+    peak = 0
+    saturated = asyncio.Event()
+
+    async def tracked_response(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if in_flight == max_concurrency:
+            saturated.set()
+        # Hold the request open until the semaphore is saturated; the timeout only
+        # bounds the failure case where requests are sent one at a time.
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(saturated.wait(), timeout=1)
+        in_flight -= 1
+        return httpx.Response(202)
+
+    route = sendgrid_route.mock(side_effect=tracked_response)
+
+    backend = SendGridBackend(config=SendGridConfig(api_key="SG.xxx", max_concurrency=max_concurrency))
+
+    # Different senders prevent batching, so each message is its own request
+    messages = [
+        EmailMessage(subject="Test", body="Body", from_email=f"sender{index}@example.com", to=["to@example.com"])
+        for index in range(5)
+    ]
+
+    count = await backend.send_messages(messages)
+
+    assert count == 5
+    assert route.call_count == 5
+    assert peak == min(len(messages), max_concurrency)
+
+
+@pytest.mark.parametrize(
+    "status, error",
+    [(429, EmailRateLimitError), (500, EmailDeliveryError)],
+)
+@pytest.mark.parametrize("provider", ["resend", "sendgrid"])
+async def test_http_backend_stops_unbatched_sends_after_error(
+    request: pytest.FixtureRequest,
+    provider: str,
+    status: int,
+    error: type[Exception],
+) -> None:
+    """Test queued sends are skipped once a request is rate limited or fails."""
+    max_concurrency = 5
+    route: respx.Route = request.getfixturevalue(f"{provider}_route")
+    route.mock(return_value=httpx.Response(status, text="Error"))
+
+    backend: ResendBackend | SendGridBackend
+    if provider == "resend":
+        backend = ResendBackend(config=ResendConfig(api_key="re_xxx", max_concurrency=max_concurrency))
+    else:
+        backend = SendGridBackend(config=SendGridConfig(api_key="SG.xxx", max_concurrency=max_concurrency))
+
+    # Distinct senders and attachments keep every message out of the batch requests
+    messages = []
+    for index in range(25):
+        message = EmailMessage(subject="Test", body="Body", from_email=f"s{index}@example.com", to=["to@example.com"])
+        message.attach("file.txt", b"content", "text/plain")
+        messages.append(message)
+
+    with pytest.raises(error):
+        await backend.send_messages(messages)
+
+    assert 1 <= route.call_count <= max_concurrency
+
+
+async def test_sendgrid_backend_uses_default_from(sendgrid_route: respx.Route) -> None:
+    """Test default from values are used when message lacks from_email."""
+    route = sendgrid_route.mock(return_value=httpx.Response(202))
 
     config = EmailConfig(
         backend=SendGridConfig(api_key="SG.xxx"),
@@ -466,78 +667,105 @@ async def test_sendgrid_backend_uses_default_from() -> None:
 
     await backend.send_messages([message])
 
-    import json
-
-    payload = json.loads(route.calls.last.request.content)
+    payload = last_payload(route)
     assert payload["from"]["email"] == "noreply@example.com"
     assert payload["from"]["name"] == "Litestar"
 
 
-@respx.mock
-async def test_sendgrid_backend_rate_limit() -> None:
-    """Test rate limit error handling."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.sendgrid import SENDGRID_API_URL, SendGridBackend
-    from litestar_email.config import SendGridConfig
-    from litestar_email.exceptions import EmailRateLimitError
+# ==============================================================================
+# Shared HTTP Backend Tests
+# ==============================================================================
 
-    respx.post(SENDGRID_API_URL).mock(return_value=httpx.Response(429, headers={"Retry-After": "30"}))
 
-    config = SendGridConfig(api_key="SG.xxx")
-    backend = SendGridBackend(config=config, fail_silently=False)
+class HTTPBackendCase(NamedTuple):
+    """An API backend under test together with its mocked send endpoint."""
+
+    label: str
+    backend: ResendBackend | SendGridBackend | MailgunBackend
+    route: respx.Route
+    ok_response: httpx.Response
+
+
+@pytest.fixture(params=["resend", "sendgrid", "mailgun"])
+def http_backend(request: pytest.FixtureRequest) -> HTTPBackendCase:
+    """Return each HTTP API backend with its mocked route and a success response."""
+    route = request.getfixturevalue(f"{request.param}_route")
+    if request.param == "resend":
+        return HTTPBackendCase(
+            "Resend",
+            ResendBackend(config=ResendConfig(api_key="re_xxx")),
+            route,
+            httpx.Response(200, json={"id": "msg_123"}),
+        )
+    if request.param == "sendgrid":
+        return HTTPBackendCase(
+            "SendGrid", SendGridBackend(config=SendGridConfig(api_key="SG.xxx")), route, httpx.Response(202)
+        )
+    return HTTPBackendCase(
+        "Mailgun",
+        MailgunBackend(config=MailgunConfig(api_key="key-xxx", domain="mg.example.com")),
+        route,
+        httpx.Response(200, json={"id": "<msg_123>", "message": "Queued. Thank you."}),
+    )
+
+
+async def test_http_backend_send_message_not_connected(http_backend: HTTPBackendCase) -> None:
+    """Test _send_message raises if not connected."""
+    backend = http_backend.backend
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+
+    with pytest.raises(RuntimeError, match=f"{http_backend.label} transport not initialized"):
+        await backend._send_message(message)
+
+
+async def test_http_backend_send_success(http_backend: HTTPBackendCase) -> None:
+    """Test successful email sending via each API."""
+    http_backend.route.mock(return_value=http_backend.ok_response)
+    backend = http_backend.backend
 
     message = EmailMessage(
         subject="Test",
         body="Body",
+        from_email="sender@example.com",
         to=["test@example.com"],
     )
 
+    count = await backend.send_messages([message])
+    assert count == 1
+    assert http_backend.route.call_count == 1
+
+
+async def test_http_backend_rate_limit(http_backend: HTTPBackendCase) -> None:
+    """Test rate limit error handling."""
+    http_backend.route.mock(return_value=httpx.Response(429, headers={"Retry-After": "60"}))
+    backend = http_backend.backend
+
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+
     with pytest.raises(EmailRateLimitError) as exc_info:
         await backend.send_messages([message])
 
-    assert exc_info.value.retry_after == 30
+    assert exc_info.value.retry_after == 60
 
 
-@respx.mock
-async def test_sendgrid_backend_api_error() -> None:
+async def test_http_backend_api_error(http_backend: HTTPBackendCase) -> None:
     """Test API error handling."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.sendgrid import SENDGRID_API_URL, SendGridBackend
-    from litestar_email.config import SendGridConfig
-    from litestar_email.exceptions import EmailDeliveryError
-
-    respx.post(SENDGRID_API_URL).mock(return_value=httpx.Response(400, json={"errors": [{"message": "Invalid"}]}))
+    http_backend.route.mock(return_value=httpx.Response(400, json={"message": "Invalid request"}))
+    backend = http_backend.backend
 
-    config = SendGridConfig(api_key="SG.xxx")
-    backend = SendGridBackend(config=config, fail_silently=False)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-    )
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
 
-    with pytest.raises(EmailDeliveryError, match="Failed to send email"):
+    with pytest.raises(EmailDeliveryError, match=f"Failed to send email .* via {http_backend.label}"):
         await backend.send_messages([message])
 
 
-@respx.mock
-async def test_sendgrid_backend_fail_silently() -> None:
+async def test_http_backend_fail_silently(http_backend: HTTPBackendCase) -> None:
     """Test fail_silently suppresses errors."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.sendgrid import SENDGRID_API_URL, SendGridBackend
-    from litestar_email.config import SendGridConfig
-
-    respx.post(SENDGRID_API_URL).mock(return_value=httpx.Response(500))
+    http_backend.route.mock(return_value=httpx.Response(500))
+    backend = http_backend.backend
+    backend.fail_silently = True
 
-    config = SendGridConfig(api_key="SG.xxx")
-    backend = SendGridBackend(config=config, fail_silently=True)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-    )
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
 
     # Should not raise
     count = await backend.send_messages([message])
@@ -551,8 +779,6 @@ async def test_sendgrid_backend_fail_silently() -> None:
 
 async def test_backends_registered() -> None:
     """Test that new backends are registered in the registry."""
-    from litestar_email import list_backends
-
     backends = list_backends()
     assert "smtp" in backends
     assert "resend" in backends
@@ -561,35 +787,24 @@ async def test_backends_registered() -> None:
 
 def test_get_backend_smtp() -> None:
     """Test getting SMTP backend via factory."""
-    from litestar_email import get_backend
-    from litestar_email.backends.smtp import SMTPBackend
-
     backend = get_backend("smtp")
     assert isinstance(backend, SMTPBackend)
 
 
 def test_get_backend_resend() -> None:
     """Test getting Resend backend via factory."""
-    from litestar_email import get_backend
-    from litestar_email.backends.resend import ResendBackend
-
     backend = get_backend("resend")
     assert isinstance(backend, ResendBackend)
 
 
 def test_get_backend_sendgrid() -> None:
     """Test getting SendGrid backend via factory."""
-    from litestar_email import get_backend
-    from litestar_email.backends.sendgrid import SendGridBackend
-
     backend = get_backend("sendgrid")
     assert isinstance(backend, SendGridBackend)
 
 
 def test_get_backend_with_config() -> None:
     """Test that config is passed to backend via factory."""
-    from litestar_email.config import EmailConfig, SMTPConfig
-
     config = EmailConfig(
         backend=SMTPConfig(host="mail.example.com", port=587),
     )
@@ -606,15 +821,10 @@ def test_get_backend_with_config() -> None:
 
 def test_mailgun_backend_requires_httpx(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that MailgunBackend raises MissingDependencyError if httpx is not installed."""
-    from litestar_email.exceptions import MissingDependencyError
-    from litestar_email.utils import dependencies
-
     # Mock module_available to return False for httpx
     monkeypatch.setattr(dependencies, "_dependency_cache", {"httpx": False})
 
     with pytest.raises(MissingDependencyError, match="httpx"):
-        from litestar_email.backends.mailgun import MailgunBackend
-
         MailgunBackend()
 
     # Restore cache
@@ -623,8 +833,6 @@ def test_mailgun_backend_requires_httpx(monkeypatch: pytest.MonkeyPatch) -> None
 
 def test_mailgun_backend_default_config() -> None:
     """Test MailgunBackend uses default config when none provided."""
-    from litestar_email.backends.mailgun import MailgunBackend
-
     backend = MailgunBackend()
     assert backend._config.api_key == ""
     assert backend._config.domain == ""
@@ -634,9 +842,6 @@ def test_mailgun_backend_default_config() -> None:
 
 def test_mailgun_backend_custom_config() -> None:
     """Test MailgunBackend accepts custom config."""
-    from litestar_email.backends.mailgun import MailgunBackend
-    from litestar_email.config import MailgunConfig
-
     config = MailgunConfig(api_key="key-xxx", domain="mg.example.com", region="eu", timeout=60)
     backend = MailgunBackend(config=config)
     assert backend._config.api_key == "key-xxx"
@@ -647,14 +852,9 @@ def test_mailgun_backend_custom_config() -> None:
 
 async def test_mailgun_backend_open_returns_false_when_connected() -> None:
     """Test that open() returns False if already connected."""
-    from unittest.mock import MagicMock
-
-    from litestar_email.backends.mailgun import MailgunBackend
-    from litestar_email.config import MailgunConfig
-
     config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
     backend = MailgunBackend(config=config)
-    backend._transport = MagicMock()
+    backend._transport = object()  # type: ignore[assignment]
 
     result = await backend.open()
     assert result is False
@@ -662,23 +862,19 @@ async def test_mailgun_backend_open_returns_false_when_connected() -> None:
 
 async def test_mailgun_backend_open_creates_transport() -> None:
     """Test that open() creates a new HTTP transport."""
-    from litestar_email.backends.mailgun import MailgunBackend
-    from litestar_email.config import MailgunConfig
-
     config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
     backend = MailgunBackend(config=config)
 
     result = await backend.open()
     assert result is True
     assert backend._transport is not None
+    assert backend._transport._client.headers["User-Agent"].startswith("litestar-email")
 
     await backend.close()
 
 
 async def test_mailgun_backend_close_when_not_connected() -> None:
     """Test that close() does nothing when not connected."""
-    from litestar_email.backends.mailgun import MailgunBackend
-
     backend = MailgunBackend()
     backend._transport = None
 
@@ -686,63 +882,18 @@ async def test_mailgun_backend_close_when_not_connected() -> None:
     await backend.close()
 
 
-async def test_mailgun_backend_send_empty_list() -> None:
-    """Test sending empty list returns 0."""
-    from litestar_email.backends.mailgun import MailgunBackend
-
+async def test_mailgun_backend_send_empty_list(respx_mock: respx.MockRouter) -> None:
+    """Test sending empty list returns 0 without opening a transport."""
     backend = MailgunBackend()
     count = await backend.send_messages([])
     assert count == 0
+    assert backend._transport is None
+    assert respx_mock.calls.call_count == 0
 
 
-async def test_mailgun_backend_send_message_not_connected() -> None:
-    """Test _send_message raises if not connected."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MailgunBackend
-
-    backend = MailgunBackend()
-    backend._transport = None
-    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
-
-    with pytest.raises(RuntimeError, match="Mailgun transport not initialized"):
-        await backend._send_message(message)
-
-
-@respx.mock
-async def test_mailgun_backend_send_success() -> None:
-    """Test successful email sending via Mailgun API."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-
-    respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued. Thank you."})
-    )
-
-    config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
-    backend = MailgunBackend(config=config)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        from_email="sender@example.com",
-        to=["test@example.com"],
-    )
-
-    count = await backend.send_messages([message])
-    assert count == 1
-
-
-@respx.mock
-async def test_mailgun_backend_send_with_all_fields() -> None:
+async def test_mailgun_backend_send_with_all_fields(mailgun_route: respx.Route) -> None:
     """Test sending email with all optional fields."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-
-    route = respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."})
-    )
+    route = mailgun_route.mock(return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."}))
 
     config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
     backend = MailgunBackend(config=config)
@@ -784,18 +935,9 @@ async def test_mailgun_backend_send_with_all_fields() -> None:
     assert "file.txt" in body
 
 
-@respx.mock
-async def test_mailgun_backend_uses_default_from() -> None:
+async def test_mailgun_backend_uses_default_from(mailgun_route: respx.Route) -> None:
     """Test default from values are used when message lacks from_email."""
-    from urllib.parse import unquote
-
-    from litestar_email import EmailConfig, EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL
-    from litestar_email.config import MailgunConfig
-
-    route = respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."})
-    )
+    route = mailgun_route.mock(return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."}))
 
     config = EmailConfig(
         backend=MailgunConfig(api_key="key-xxx", domain="mg.example.com"),
@@ -819,91 +961,9 @@ async def test_mailgun_backend_uses_default_from() -> None:
     assert "noreply@example.com" in body
 
 
-@respx.mock
-async def test_mailgun_backend_rate_limit() -> None:
-    """Test rate limit error handling."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-    from litestar_email.exceptions import EmailRateLimitError
-
-    respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(429, headers={"Retry-After": "60"})
-    )
-
-    config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
-    backend = MailgunBackend(config=config, fail_silently=False)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-    )
-
-    with pytest.raises(EmailRateLimitError) as exc_info:
-        await backend.send_messages([message])
-
-    assert exc_info.value.retry_after == 60
-
-
-@respx.mock
-async def test_mailgun_backend_api_error() -> None:
-    """Test API error handling."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-    from litestar_email.exceptions import EmailDeliveryError
-
-    respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(400, json={"message": "Invalid request"})
-    )
-
-    config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
-    backend = MailgunBackend(config=config, fail_silently=False)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-    )
-
-    with pytest.raises(EmailDeliveryError, match="Failed to send email"):
-        await backend.send_messages([message])
-
-
-@respx.mock
-async def test_mailgun_backend_fail_silently() -> None:
-    """Test fail_silently suppresses errors."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-
-    respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(return_value=httpx.Response(500))
-
-    config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
-    backend = MailgunBackend(config=config, fail_silently=True)
-
-    message = EmailMessage(
-        subject="Test",
-        body="Body",
-        to=["test@example.com"],
-    )
-
-    # Should not raise
-    count = await backend.send_messages([message])
-    assert count == 0
-
-
-@respx.mock
-async def test_mailgun_backend_us_region() -> None:
+async def test_mailgun_backend_us_region(mailgun_route: respx.Route) -> None:
     """Test that US region uses the default API endpoint."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-
-    route = respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."})
-    )
+    route = mailgun_route.mock(return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."}))
 
     config = MailgunConfig(api_key="key-xxx", domain="mg.example.com", region="us")
     backend = MailgunBackend(config=config)
@@ -915,14 +975,9 @@ async def test_mailgun_backend_us_region() -> None:
     assert route.calls.last.request.url.host == "api.mailgun.net"
 
 
-@respx.mock
-async def test_mailgun_backend_eu_region() -> None:
+async def test_mailgun_backend_eu_region(respx_mock: respx.MockRouter) -> None:
     """Test that EU region uses the EU API endpoint."""
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_EU_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-
-    route = respx.post(f"{MAILGUN_EU_URL}/v3/mg.example.com/messages").mock(
+    route = respx_mock.post(f"{MAILGUN_EU_URL}/v3/mg.example.com/messages").mock(
         return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."})
     )
 
@@ -936,18 +991,9 @@ async def test_mailgun_backend_eu_region() -> None:
     assert route.calls.last.request.url.host == "api.eu.mailgun.net"
 
 
-@respx.mock
-async def test_mailgun_backend_custom_headers_prefixed() -> None:
+async def test_mailgun_backend_custom_headers_prefixed(mailgun_route: respx.Route) -> None:
     """Test that custom headers are prefixed with h:."""
-    from urllib.parse import unquote
-
-    from litestar_email import EmailMessage
-    from litestar_email.backends.mailgun import MAILGUN_US_URL, MailgunBackend
-    from litestar_email.config import MailgunConfig
-
-    route = respx.post(f"{MAILGUN_US_URL}/v3/mg.example.com/messages").mock(
-        return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."})
-    )
+    route = mailgun_route.mock(return_value=httpx.Response(200, json={"id": "<msg_123>", "message": "Queued."}))
 
     config = MailgunConfig(api_key="key-xxx", domain="mg.example.com")
     backend = MailgunBackend(config=config)
@@ -970,16 +1016,11 @@ async def test_mailgun_backend_custom_headers_prefixed() -> None:
 
 async def test_mailgun_backends_registered() -> None:
     """Test that Mailgun backend is registered in the registry."""
-    from litestar_email import list_backends
-
     backends = list_backends()
     assert "mailgun" in backends
 
 
 def test_get_backend_mailgun() -> None:
     """Test getting Mailgun backend via factory."""
-    from litestar_email import get_backend
-    from litestar_email.backends.mailgun import MailgunBackend
-
     backend = get_backend("mailgun")
     assert isinstance(backend, MailgunBackend)
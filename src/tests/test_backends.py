@@ -14,6 +14,20 @@ def test_list_backends() -> None:
     assert "memory" in backends
 
 
+def test_list_backends_refreshes_after_register(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that registering a backend invalidates the cached backend list."""
+    from litestar_email import backends
+    from litestar_email.backends import InMemoryBackend, list_backends, register_backend
+
+    list_backends()
+    monkeypatch.setattr(backends, "_backend_registry", dict(backends._backend_registry))
+    monkeypatch.setattr(backends, "_backends_list_cache", backends._backends_list_cache)
+
+    assert "custom-memory" not in list_backends()
+    register_backend("custom-memory")(InMemoryBackend)
+    assert "custom-memory" in list_backends()
+
+
 def test_get_backend_class_by_name() -> None:
     """Test getting a backend class by short name."""
     from litestar_email import get_backend_class
@@ -32,6 +46,30 @@ def test_get_backend_class_by_path() -> None:
     assert cls is ConsoleBackend
 
 
+def test_builtin_backend_paths_are_preseeded() -> None:
+    """Test that built-in full import paths resolve without populating list_backends."""
+    from litestar_email import list_backends
+    from litestar_email.backends import _resolved_backends
+    from litestar_email.backends.smtp import SMTPBackend
+
+    backends = list_backends()
+
+    assert _resolved_backends["litestar_email.backends.smtp.SMTPBackend"] is SMTPBackend
+    assert all("." not in name for name in backends)
+
+
+def test_get_backend_class_by_path_is_memoized() -> None:
+    """Test that full import path lookups are cached after the first resolution."""
+    from litestar_email import get_backend_class
+    from litestar_email.backends import _resolved_backends
+    from litestar_email.backends.memory import InMemoryBackend
+
+    backend_path = "litestar_email.backends.memory.InMemoryBackend"
+    assert get_backend_class(backend_path) is InMemoryBackend
+    assert _resolved_backends[backend_path] is InMemoryBackend
+    assert get_backend_class(backend_path) is InMemoryBackend
+
+
 def test_get_backend_class_unknown() -> None:
     """Test that unknown backend raises ValueError."""
     from litestar_email import get_backend_class
@@ -40,6 +78,42 @@ def test_get_backend_class_unknown() -> None:
         get_backend_class("unknown")
 
 
+@pytest.mark.parametrize("backend_path", [".ConsoleBackend", "litestar_email.backends.console.", "a.b.not-a-class"])
+def test_get_backend_class_invalid_path(backend_path: str) -> None:
+    """Test that malformed import paths are rejected before importing."""
+    from litestar_email import get_backend_class
+
+    with pytest.raises(ValueError, match="Invalid backend import path"):
+        get_backend_class(backend_path)
+
+
+def test_backends_lazy_attribute_access() -> None:
+    """Test that backend classes resolve lazily and are cached on the package."""
+    from litestar_email import backends
+    from litestar_email.backends.smtp import SMTPBackend
+
+    assert backends.SMTPBackend is SMTPBackend
+    assert vars(backends)["SMTPBackend"] is SMTPBackend
+    assert "SMTPBackend" in dir(backends)
+
+    with pytest.raises(AttributeError, match="NotABackend"):
+        _ = backends.NotABackend
+
+
+def test_package_lazy_public_api() -> None:
+    """Test that every public name resolves lazily from the package root."""
+    import litestar_email
+    from litestar_email.plugin import EmailPlugin
+
+    assert sorted(dir(litestar_email)) == sorted(litestar_email.__all__)
+    for name in litestar_email.__all__:
+        assert getattr(litestar_email, name) is not None
+    assert litestar_email.EmailPlugin is EmailPlugin
+
+    with pytest.raises(AttributeError, match="not_a_name"):
+        _ = litestar_email.not_a_name
+
+
 def test_get_backend_instance() -> None:
     """Test getting an instantiated backend."""
     from litestar_email import get_backend
@@ -50,6 +124,32 @@ def test_get_backend_instance() -> None:
     assert backend.fail_silently is False
 
 
+def test_backend_init_inspection_is_cached() -> None:
+    """Test that backend constructor inspection runs once per class."""
+    from litestar_email.backends import _inspect_init
+    from litestar_email.backends.console import ConsoleBackend
+
+    accepts_kwargs, param_names = result = _inspect_init(ConsoleBackend)
+
+    assert accepts_kwargs is False
+    assert param_names == {"self", "fail_silently", "stream", "default_from_email", "default_from_name"}
+    assert _inspect_init(ConsoleBackend) is result
+
+
+@pytest.mark.parametrize("name", ["console", "memory", "smtp", "resend", "sendgrid", "mailgun"])
+def test_builtin_backend_init_fields_match_signature(name: str) -> None:
+    """Test that declared __backend_init_fields__ are accepted by each built-in constructor."""
+    from inspect import signature
+
+    from litestar_email import get_backend_class
+
+    backend_class = get_backend_class(name)
+    fields = vars(backend_class)["__backend_init_fields__"]
+
+    assert fields is not None
+    assert fields <= set(signature(backend_class.__init__).parameters)
+
+
 def test_get_backend_with_fail_silently() -> None:
     """Test backend respects fail_silently parameter."""
     from litestar_email import get_backend
@@ -52,6 +52,21 @@ def test_email_message_attach() -> None:
     assert message.attachments[0] == ("file.pdf", b"content", "application/pdf")
 
 
+def test_email_message_base64_attachments_cached() -> None:
+    """Test that attachment content is base64-encoded once and reused."""
+    from litestar_email import EmailMessage
+
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    message.attach("file.pdf", b"content", "application/pdf")
+
+    first = message.base64_attachments()
+    assert first == [("file.pdf", "Y29udGVudA==", "application/pdf")]
+    assert message.base64_attachments()[0][1] is first[0][1]
+
+    message.attach("other.txt", b"more", "text/plain")
+    assert message.base64_attachments()[1] == ("other.txt", "bW9yZQ==", "text/plain")
+
+
 def test_email_message_attach_alternative() -> None:
     """Test that alternative content can be added to a message."""
     from litestar_email import EmailMessage
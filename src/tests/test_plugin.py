@@ -5,11 +5,17 @@ import pytest
 if TYPE_CHECKING:
     from litestar import Litestar
 
-    from litestar_email import EmailConfig, EmailPlugin
+    from litestar_email import EmailConfig, EmailPlugin, EmailService
+    from litestar_email.backends import BaseEmailBackend
 
 pytestmark = pytest.mark.anyio
 
 
+def _held_backend(service: "EmailService") -> "BaseEmailBackend | None":
+    """Return the backend currently held by ``service``, without narrowing it for later reads."""
+    return service._backend
+
+
 def test_plugin_instantiation_with_defaults() -> None:
     """Test that the plugin can be instantiated with default configuration."""
     from litestar_email import EmailPlugin
@@ -67,3 +73,138 @@ def test_plugin_registers_dependencies_and_state() -> None:
     assert app_config.state[config.email_service_state_key] is config
     assert "EmailService" in app_config.signature_namespace
     assert isinstance(plugin.get_service(app_config.state), EmailService)
+
+
+def test_signature_namespace_is_shared_and_read_only() -> None:
+    """Test that the signature namespace is built once and shared across configs."""
+    from litestar_email import EmailConfig, EmailService
+
+    first = EmailConfig().signature_namespace
+    second = EmailConfig(backend="memory").signature_namespace
+
+    assert first is second
+    assert first["EmailService"] is EmailService
+    with pytest.raises(TypeError):
+        first["EmailService"] = object()  # type: ignore[index]
+
+
+def test_plugin_get_backend_delegates_to_config() -> None:
+    """Test that the plugin's bound delegates honour the fail_silently override."""
+    from litestar_email import EmailConfig, EmailPlugin, InMemoryBackend
+
+    plugin = EmailPlugin(config=EmailConfig(backend="memory"))
+
+    backend = plugin.get_backend(fail_silently=True)
+    assert isinstance(backend, InMemoryBackend)
+    assert backend.fail_silently is True
+    assert plugin.get_backend().fail_silently is False
+
+
+async def test_plugin_shares_service_across_requests() -> None:
+    """Test that the injected EmailService is opened once and shared for the app lifetime."""
+    from litestar import Litestar, get
+    from litestar.testing import AsyncTestClient
+
+    from litestar_email import EmailConfig, EmailPlugin, EmailService
+
+    @get("/")
+    async def handler(mailer: EmailService) -> dict[str, int]:
+        return {"id": id(mailer)}
+
+    config = EmailConfig(backend="memory")
+    app = Litestar([handler], plugins=[EmailPlugin(config=config)])
+
+    async with AsyncTestClient(app) as client:
+        service = app.state[config.email_service_state_key]
+        assert isinstance(service, EmailService)
+
+        first = (await client.get("/")).json()["id"]
+        second = (await client.get("/")).json()["id"]
+        assert first == second == id(service)
+
+    assert app.state[config.email_service_state_key] is config
+
+
+async def test_plugin_shared_service_survives_handler_context() -> None:
+    """Test that ``async with mailer`` in a handler does not close the shared service."""
+    from litestar import Litestar, get
+    from litestar.testing import AsyncTestClient
+
+    from litestar_email import EmailConfig, EmailMessage, EmailPlugin, EmailService, InMemoryBackend
+
+    @get("/")
+    async def handler(mailer: EmailService) -> None:
+        async with mailer:
+            await mailer.send_message(EmailMessage(subject="Test", body="Body", to=["test@example.com"]))
+
+    InMemoryBackend.clear()
+    config = EmailConfig(backend="memory")
+    app = Litestar([handler], plugins=[EmailPlugin(config=config)])
+
+    async with AsyncTestClient(app) as client:
+        service = app.state[config.email_service_state_key]
+        await client.get("/")
+        backend = _held_backend(service)
+        assert isinstance(backend, InMemoryBackend)
+
+        await client.get("/")
+        assert _held_backend(service) is backend
+
+    assert _held_backend(service) is None
+    assert len(InMemoryBackend.outbox) == 2
+
+
+async def test_plugin_starts_when_backend_unreachable() -> None:
+    """Test that an unreachable SMTP server does not fail application startup."""
+    from litestar import Litestar
+    from litestar.testing import AsyncTestClient
+
+    from litestar_email import EmailConfig, EmailPlugin, EmailService, SMTPConfig
+
+    config = EmailConfig(backend=SMTPConfig(host="127.0.0.1", port=1, timeout=1))
+    app = Litestar(plugins=[EmailPlugin(config=config)])
+
+    async with AsyncTestClient(app):
+        service = app.state[config.email_service_state_key]
+        assert isinstance(service, EmailService)
+        assert _held_backend(service) is None
+
+
+async def test_plugin_per_request_service() -> None:
+    """Test that per_request_service opens and closes a dedicated backend for each request."""
+    from unittest.mock import patch
+
+    from litestar import Litestar, get
+    from litestar.testing import AsyncTestClient
+
+    from litestar_email import EmailConfig, EmailPlugin, EmailService, InMemoryBackend
+
+    services: list[EmailService] = []
+    backends: list[BaseEmailBackend] = []
+
+    @get("/")
+    async def handler(mailer: EmailService) -> None:
+        backend = _held_backend(mailer)
+        assert isinstance(backend, InMemoryBackend)
+        open_mock.assert_awaited_with(backend)
+        assert backend not in [call.args[0] for call in close_mock.await_args_list]
+        services.append(mailer)
+        backends.append(backend)
+
+    config = EmailConfig(backend="memory", per_request_service=True)
+    app = Litestar([handler], plugins=[EmailPlugin(config=config)])
+
+    with (
+        patch.object(InMemoryBackend, "open", autospec=True, return_value=True) as open_mock,
+        patch.object(InMemoryBackend, "close", autospec=True) as close_mock,
+    ):
+        async with AsyncTestClient(app) as client:
+            await client.get("/")
+            await client.get("/")
+            assert app.state[config.email_service_state_key] is config
+
+    assert len(services) == 2
+    assert services[0] is not services[1]
+    assert backends[0] is not backends[1]
+    assert [call.args[0] for call in close_mock.await_args_list] == backends
+    assert all(_held_backend(service) is None for service in services)
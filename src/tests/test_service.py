@@ -1,10 +1,21 @@
 """Tests for EmailService."""
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    from litestar_email import EmailService
+    from litestar_email.backends import BaseEmailBackend
+
 pytestmark = pytest.mark.anyio
 
 
+def _held_backend(service: "EmailService") -> "BaseEmailBackend | None":
+    """Return the backend currently held by ``service``, without narrowing it for later reads."""
+    return service._backend
+
+
 async def test_email_service_sends_messages_memory_backend() -> None:
     """Test EmailService sends messages via the configured backend."""
     from litestar_email import EmailConfig, EmailMessage, EmailService
@@ -26,6 +37,86 @@ async def test_email_service_sends_messages_memory_backend() -> None:
     assert len(InMemoryBackend.outbox) == 1
 
 
+async def test_email_service_nested_context_keeps_backend_open() -> None:
+    """Test only the outermost ``async with`` closes the service backend."""
+    from litestar_email import EmailConfig, EmailService
+
+    service = EmailService(EmailConfig(backend="memory"))
+
+    async with service:
+        backend = _held_backend(service)
+        assert backend is not None
+        async with service:
+            assert _held_backend(service) is backend
+        assert _held_backend(service) is backend
+
+    assert _held_backend(service) is None
+
+
+async def test_email_service_lazy_open_retries_after_failure() -> None:
+    """Test a lazily held service retries a failed backend open on the next send."""
+    from unittest.mock import AsyncMock, patch
+
+    from litestar_email import EmailConfig, EmailMessage, EmailService, InMemoryBackend
+
+    InMemoryBackend.clear()
+    service = EmailService(EmailConfig(backend="memory"))
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    await service.open(lazy=True)
+    assert _held_backend(service) is None
+
+    with patch.object(InMemoryBackend, "open", AsyncMock(side_effect=ConnectionError)), pytest.raises(ConnectionError):
+        await service.send_message(message)
+    assert _held_backend(service) is None
+
+    assert await service.send_message(message) == 1
+    assert _held_backend(service) is not None
+
+    await service.close()
+    assert _held_backend(service) is None
+
+
+async def test_email_service_lazy_open_retries_after_silent_failure() -> None:
+    """Test a backend whose open failed silently is not held for later sends."""
+    from unittest.mock import AsyncMock, patch
+
+    from litestar_email import EmailConfig, EmailMessage, EmailService, InMemoryBackend
+
+    InMemoryBackend.clear()
+    service = EmailService(EmailConfig(backend="memory"))
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    await service.open(lazy=True)
+
+    with patch.object(InMemoryBackend, "open", AsyncMock(return_value=False)) as mock_open:
+        assert await service.send_message(message) == 1
+        assert _held_backend(service) is None
+        assert await service.send_message(message) == 1
+        assert mock_open.await_count == 2
+    assert _held_backend(service) is None
+
+    assert await service.send_message(message) == 1
+    assert _held_backend(service) is not None
+
+    await service.close()
+    assert _held_backend(service) is None
+
+
+async def test_send_mass_mail_memory_backend() -> None:
+    """Test send_mass_mail sends every message through the configured backend."""
+    from litestar_email import EmailConfig, EmailMessage, send_mass_mail
+    from litestar_email.backends import InMemoryBackend
+
+    InMemoryBackend.clear()
+    config = EmailConfig(backend="memory")
+
+    messages = [EmailMessage(subject=f"Test {index}", body="Body", to=["test@example.com"]) for index in range(3)]
+
+    count = await send_mass_mail(messages, config)
+
+    assert count == 3
+    assert [message.subject for message in InMemoryBackend.outbox] == ["Test 0", "Test 1", "Test 2"]
+
+
 def test_config_get_service_uses_state_config() -> None:
     """Test EmailConfig.get_service returns service from cached config."""
     from litestar.datastructures import State
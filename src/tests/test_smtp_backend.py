@@ -1,12 +1,16 @@
 """Tests for SMTP email backend."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
 
 import aiosmtplib
 import pytest
 
 from litestar_email.utils import dependencies
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 pytestmark = pytest.mark.anyio
 
 
@@ -57,7 +61,7 @@ async def test_smtp_backend_open_returns_false_when_connected() -> None:
     from litestar_email.backends.smtp import SMTPBackend
 
     backend = SMTPBackend()
-    backend._connection = MagicMock()  # Simulate existing connection
+    backend._connection = object()  # type: ignore[assignment]  # Simulate existing connection
 
     result = await backend.open()
     assert result is False
@@ -336,3 +340,273 @@ async def test_smtp_backend_starttls_upgrade() -> None:
         await backend.open()
 
         mock_smtp.starttls.assert_called_once()
+
+
+def _client_factory(clients: list[AsyncMock]) -> "Callable[..., AsyncMock]":
+    """Build a stand-in for ``aiosmtplib.SMTP`` that records every client it creates.
+
+    Returns:
+        A callable accepting the ``aiosmtplib.SMTP`` keyword arguments.
+    """
+
+    def factory(**_: object) -> AsyncMock:
+        client = AsyncMock()
+        client.is_connected = True
+        clients.append(client)
+        return client
+
+    return factory
+
+
+async def test_smtp_backend_pool_reuses_connections() -> None:
+    """Test pooled sends share pool_size connections opened once."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    backend = SMTPBackend(config=SMTPConfig(host="localhost", port=1025, pool_size=3))
+    messages = [EmailMessage(subject=f"Test {i}", body="Body", to=[f"user{i}@example.com"]) for i in range(7)]
+    clients: list[AsyncMock] = []
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory(clients)):
+        async with backend:
+            assert backend._pool is not None
+            assert backend._pool.idle == 3
+            count = await backend.send_messages(messages)
+            assert backend._pool.idle == 3
+
+    assert count == 7
+    assert len(clients) == 3
+    assert sum(client.send_message.await_count for client in clients) == 7
+    for client in clients:
+        client.connect.assert_awaited_once()
+        client.quit.assert_awaited_once()
+    assert backend._pool is None
+
+
+async def test_smtp_backend_pool_replaces_connections_after_max_reuse() -> None:
+    """Test a pooled connection is replaced once it has sent max_reuse messages."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=2, max_reuse=2))
+    messages = [EmailMessage(subject="Test", body="Body", to=["test@example.com"]) for _ in range(6)]
+    clients: list[AsyncMock] = []
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory(clients)):
+        async with backend:
+            count = await backend.send_messages(messages)
+
+    assert count == 6
+    assert len(clients) == 4
+    assert [client.send_message.await_count for client in clients] == [2, 2, 1, 1]
+    for client in clients:
+        client.quit.assert_awaited_once()
+
+
+async def test_smtp_backend_pool_replaces_expired_connections() -> None:
+    """Test a pooled connection older than connection_ttl is replaced before use."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=2, connection_ttl=0))
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    clients: list[AsyncMock] = []
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory(clients)):
+        async with backend:
+            await backend.send_messages([message])
+
+    assert len(clients) == 3
+    clients[0].send_message.assert_not_awaited()
+    clients[2].send_message.assert_awaited_once()
+
+
+async def test_smtp_backend_pool_replaces_dropped_connections() -> None:
+    """Test a pooled connection closed by the server is replaced before use."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=2))
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    clients: list[AsyncMock] = []
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory(clients)):
+        async with backend:
+            clients[0].is_connected = False
+            await backend.send_messages([message])
+
+    assert len(clients) == 3
+    clients[0].send_message.assert_not_awaited()
+    clients[2].send_message.assert_awaited_once()
+
+
+async def test_smtp_backend_reconnects_dropped_single_connection() -> None:
+    """Test the single connection is reopened when the server has dropped it."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+
+    backend = SMTPBackend()
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    clients: list[AsyncMock] = []
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory(clients)):
+        async with backend:
+            await backend.send_messages([message])
+            clients[0].is_connected = False
+            await backend.send_messages([message])
+            assert backend._connection is clients[1]
+
+    assert len(clients) == 2
+    clients[0].send_message.assert_awaited_once()
+    clients[0].quit.assert_awaited_once()
+    clients[1].send_message.assert_awaited_once()
+    clients[1].quit.assert_awaited_once()
+
+
+async def test_smtp_backend_pool_open_failure_closes_opened_connections() -> None:
+    """Test a failed pool fill quits the connections it already opened."""
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+    from litestar_email.exceptions import EmailConnectionError
+
+    clients: list[AsyncMock] = []
+    factory = _client_factory(clients)
+
+    def failing_factory(**kwargs: object) -> AsyncMock:
+        client = factory(**kwargs)
+        if len(clients) == 3:
+            client.connect.side_effect = aiosmtplib.SMTPConnectError("Connection failed")
+        return client
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=3))
+    with patch("aiosmtplib.SMTP", side_effect=failing_factory), pytest.raises(EmailConnectionError):
+        await backend.open()
+
+    assert backend._pool is None
+    clients[0].quit.assert_awaited_once()
+    clients[1].quit.assert_awaited_once()
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=3), fail_silently=True)
+    clients.clear()
+    with patch("aiosmtplib.SMTP", side_effect=failing_factory):
+        assert await backend.open() is False
+    assert backend._pool is None
+
+
+async def test_smtp_backend_pool_delivery_error() -> None:
+    """Test a failed pooled send raises and still returns the connection to the pool."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+    from litestar_email.exceptions import EmailDeliveryError
+
+    good = EmailMessage(subject="Test", body="Body", to=["good@example.com"])
+    bad = EmailMessage(subject="Test", body="Body", to=["bad@example.com"])
+
+    async def send_message(message: object) -> None:
+        if "bad@example.com" in str(message):
+            raise aiosmtplib.SMTPRecipientsRefused([])
+
+    clients: list[AsyncMock] = []
+    factory = _client_factory(clients)
+
+    def refusing_factory(**kwargs: object) -> AsyncMock:
+        client = factory(**kwargs)
+        client.send_message.side_effect = send_message
+        return client
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=2))
+    with patch("aiosmtplib.SMTP", side_effect=refusing_factory):
+        async with backend:
+            with pytest.raises(EmailDeliveryError, match=r"bad@example\.com"):
+                await backend.send_messages([good, bad, good])
+            assert backend._pool is not None
+            assert backend._pool.idle == 2
+
+            backend.fail_silently = True
+            assert await backend.send_messages([good, bad, good]) == 2
+
+
+async def test_smtp_backend_pool_close_quits_connections_in_use() -> None:
+    """Test closing the pool mid-send quits the busy connection once it is released."""
+    import asyncio
+
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def send_message(_: object) -> None:
+        started.set()
+        await finish.wait()
+
+    clients: list[AsyncMock] = []
+    factory = _client_factory(clients)
+
+    def slow_factory(**kwargs: object) -> AsyncMock:
+        client = factory(**kwargs)
+        client.send_message.side_effect = send_message
+        return client
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=2))
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+
+    with patch("aiosmtplib.SMTP", side_effect=slow_factory):
+        await backend.open()
+        task = asyncio.create_task(backend.send_messages([message]))
+        await started.wait()
+        await backend.close()
+        finish.set()
+        assert await task == 1
+
+    assert len(clients) == 2
+    assert [client.quit.await_count for client in clients] == [1, 1]
+
+
+async def test_smtp_backend_pool_implicit_open_connects_lazily() -> None:
+    """Test a one-off pooled send only connects the clients it needs."""
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=3))
+    message = EmailMessage(subject="Test", body="Body", to=["test@example.com"])
+    clients: list[AsyncMock] = []
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory(clients)):
+        assert await backend.send_messages([message]) == 1
+
+    assert len(clients) == 1
+    clients[0].quit.assert_awaited_once()
+    assert backend._pool is None
+
+
+async def test_smtp_backend_on_idle_callback() -> None:
+    """Test on_idle callbacks run each time a pooled connection is released."""
+    import asyncio
+
+    from litestar_email import EmailMessage
+    from litestar_email.backends.smtp import SMTPBackend
+    from litestar_email.config import SMTPConfig
+
+    calls: list[int] = []
+
+    async def on_idle() -> None:
+        calls.append(1)
+
+    backend = SMTPBackend(config=SMTPConfig(pool_size=2))
+    backend.on_idle(on_idle)
+    messages = [EmailMessage(subject="Test", body="Body", to=["test@example.com"]) for _ in range(3)]
+
+    with patch("aiosmtplib.SMTP", side_effect=_client_factory([])):
+        async with backend:
+            await backend.send_messages(messages)
+            await asyncio.sleep(0)
+
+    assert len(calls) == 3
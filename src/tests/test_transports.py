@@ -1,11 +1,15 @@
 """Tests for HTTP transport layer."""
 
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from litestar_email.utils import dependencies
 
+if TYPE_CHECKING:
+    import respx
+
 pytestmark = pytest.mark.anyio
 
 
@@ -62,6 +66,44 @@ def test_get_transport_custom_class() -> None:
     assert transport.initialized is True
 
 
+# --- JSON Encoding Tests ---
+
+
+def test_encode_json_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test encode_json falls back to compact stdlib JSON without orjson."""
+    from litestar_email.utils import serialization
+
+    monkeypatch.setattr(dependencies, "_dependency_cache", {"orjson": False, "msgspec": False})
+    monkeypatch.setattr(serialization, "_encoder", None)
+
+    assert serialization.encode_json({"subject": "Héllo", "to": ["a@example.com"]}) == (
+        '{"subject":"Héllo","to":["a@example.com"]}'.encode()
+    )
+
+
+def test_encode_json_msgspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test encode_json uses msgspec when orjson is not installed."""
+    import msgspec
+
+    from litestar_email.utils import serialization
+
+    monkeypatch.setattr(dependencies, "_dependency_cache", {"orjson": False})
+    monkeypatch.setattr(serialization, "_encoder", None)
+
+    assert serialization.encode_json([{"subject": "Héllo"}]) == msgspec.json.encode([{"subject": "Héllo"}])
+    assert serialization._encoder.__self__.__class__ is msgspec.json.Encoder  # type: ignore[union-attr]
+
+
+def test_encode_json_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test encode_json produces the same bytes with orjson installed."""
+    pytest.importorskip("orjson")
+
+    from litestar_email.utils import serialization
+
+    monkeypatch.setattr(serialization, "_encoder", None)
+    assert serialization.encode_json({"subject": "Héllo"}) == '{"subject":"Héllo"}'.encode()
+
+
 # --- Httpx Transport Tests ---
 
 
@@ -95,6 +137,65 @@ async def test_httpx_transport_open_close() -> None:
     assert transport._client is None
 
 
+async def test_httpx_transport_pool_settings() -> None:
+    """Test HttpxTransport applies the requested pool sizing and keep-alive."""
+    from litestar_email.transports.httpx import HttpxTransport
+
+    transport = HttpxTransport()
+    await transport.open(max_connections=50, max_keepalive_connections=5, keepalive_expiry=75.0)
+
+    pool = transport._client._transport._pool  # type: ignore[union-attr]
+    assert pool._max_connections == 50
+    assert pool._max_keepalive_connections == 5
+    assert pool._keepalive_expiry == 75.0
+
+    await transport.close()
+
+
+async def test_httpx_transport_stage_timeouts() -> None:
+    """Test HttpxTransport uses per-stage timeouts, falling back to timeout."""
+    from litestar_email.transports.httpx import HttpxTransport
+
+    transport = HttpxTransport()
+    await transport.open(timeout=30.0, connect_timeout=5.0, pool_timeout=2.0)
+
+    timeout = transport._client.timeout  # type: ignore[union-attr]
+    assert timeout.connect == 5.0
+    assert timeout.read == 30.0
+    assert timeout.write == 30.0
+    assert timeout.pool == 2.0
+
+    await transport.close()
+
+
+async def test_httpx_transport_http2_requires_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test HttpxTransport stays on HTTP/1.1 when h2 is not installed."""
+    monkeypatch.setattr(dependencies, "_dependency_cache", {"httpx": True, "h2": False})
+
+    from litestar_email.transports.httpx import HttpxTransport
+
+    transport = HttpxTransport()
+    await transport.open(http2=True)
+
+    assert transport._client._transport._pool._http2 is False  # type: ignore[union-attr]
+
+    await transport.close()
+
+
+async def test_httpx_transport_http2_enabled() -> None:
+    """Test HttpxTransport negotiates HTTP/2 when h2 is installed."""
+    pytest.importorskip("h2")
+
+    from litestar_email.transports.httpx import HttpxTransport
+
+    transport = HttpxTransport()
+    await transport.open(http2=True)
+
+    assert transport._client._transport._pool._http2 is True  # type: ignore[union-attr]
+
+    await transport.close()
+
+
 async def test_httpx_transport_context_manager() -> None:
     """Test HttpxTransport works as async context manager."""
     from litestar_email.transports.httpx import HttpxTransport
@@ -144,6 +245,27 @@ async def test_httpx_transport_post_json() -> None:
         mock_client.post.assert_called_once()
 
 
+async def test_httpx_transport_post_json_body(respx_mock: "respx.MockRouter") -> None:
+    """Test HttpxTransport sends pre-encoded JSON bytes with a JSON content type."""
+    import json
+
+    import httpx
+
+    from litestar_email.transports.httpx import HttpxTransport
+
+    transport = HttpxTransport()
+    await transport.open()
+
+    route = respx_mock.post("https://api.example.com/emails").mock(return_value=httpx.Response(200))
+    await transport.post("https://api.example.com/emails", json=[{"subject": "Héllo"}])
+
+    request = route.calls.last.request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == [{"subject": "Héllo"}]
+
+    await transport.close()
+
+
 async def test_httpx_transport_post_form_data() -> None:
     """Test HttpxTransport.post with form-data payload."""
     from litestar_email.transports.httpx import HttpxTransport
@@ -248,6 +370,22 @@ async def test_aiohttp_transport_open_close() -> None:
     assert transport._session is None
 
 
+async def test_aiohttp_transport_stage_timeouts() -> None:
+    """Test AiohttpTransport maps per-stage timeouts onto ClientTimeout."""
+    from litestar_email.transports.aiohttp import AiohttpTransport
+
+    transport = AiohttpTransport()
+    await transport.open(timeout=30.0, connect_timeout=5.0, read_timeout=20.0, pool_timeout=2.0)
+
+    timeout = transport._session.timeout  # type: ignore[union-attr]
+    assert timeout.total == 30.0
+    assert timeout.connect == 7.0
+    assert timeout.sock_connect == 5.0
+    assert timeout.sock_read == 20.0
+
+    await transport.close()
+
+
 async def test_aiohttp_transport_context_manager() -> None:
     """Test AiohttpTransport works as async context manager."""
     from litestar_email.transports.aiohttp import AiohttpTransport